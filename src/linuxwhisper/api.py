@@ -6,16 +6,26 @@ from __future__ import annotations
 import os
 import sys
 
+import httpx
 from groq import Groq
 
 
+def _init_http_client() -> httpx.Client:
+    """Shared keep-alive HTTP/2 pool so chat, vision, Whisper and TTS reuse connections."""
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=60),
+        timeout=httpx.Timeout(connect=3.0, read=60.0, write=10.0, pool=5.0),
+    )
+
+
 def _init_groq_client() -> Groq:
     """Initialize Groq API client with environment key."""
     api_key = os.environ.get("GROQ_API_KEY")
     if not api_key:
         print("❌ Error: GROQ_API_KEY missing. Please check your environment variables!")
         sys.exit(1)
-    return Groq(api_key=api_key)
+    return Groq(api_key=api_key, http_client=_init_http_client())
 
 
 GROQ_CLIENT = _init_groq_client()
@@ -6,7 +6,6 @@ To change a setting, edit the default value below.
 """
 from __future__ import annotations
 
-import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
@@ -93,9 +92,13 @@ class Config:
 
     # --- Audio Settings ---
     SAMPLE_RATE: int = 44100
+    MAX_RECORD_SEC: int = 280  # Fits Groq's 25 MB upload limit as 16-bit WAV
+    AUDIO_BLOCKSIZE: int = 2048  # Frames per callback (~46 ms at 44.1 kHz)
 
     # --- History Limits ---
     MAX_TOKENS: int = 32000
+    HISTORY_MAX_TURNS: int = 20  # Recent messages sent verbatim; older ones are summarized
+    SUMMARY_MAX_TOKENS: int = 300
     ANSWER_HISTORY_LIMIT: int = 15
     CHAT_MESSAGE_LIMIT: int = 20
     CHAT_AUTO_HIDE_SEC: int = 3
@@ -105,16 +108,17 @@ class Config:
     MODEL_VISION: str = "meta-llama/llama-4-scout-17b-16e-instruct"
     MODEL_WHISPER: str = "whisper-large-v3"
     MODEL_TTS: str = "canopylabs/orpheus-v1-english"
+    MODEL_FAST: str = "llama-3.1-8b-instant"  # Background tasks (history summaries)
+
+    # --- Vision Upload ---
+    VISION_MAX_DIM: int = 1568  # Longest screenshot side sent to the vision model
+    VISION_JPEG_QUALITY: int = 85
 
     # --- TTS Voices ---
     TTS_VOICES: Tuple[str, ...] = ("diana", "hannah", "autumn", "austin", "daniel", "troy")
     TTS_DEFAULT_VOICE: str = "diana"
     TTS_MAX_CHARS: int = 4000
 
-    # --- Temp File Paths ---
-    TEMP_SCREEN_PATH: str = f"/tmp/temp_screen_{os.getuid()}.png"
-    TEMP_TTS_PATH: str = f"/tmp/linuxwhisper_tts_{os.getuid()}.wav"
-
     # --- System Prompt ---
     SYSTEM_PROMPT: str = (
         "Act as a compassionate assistant. Base your reasoning on the principles of "
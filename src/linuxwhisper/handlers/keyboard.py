@@ -3,7 +3,8 @@ Global keyboard listener with data-driven key mappings.
 """
 from __future__ import annotations
 
-
+import queue
+import threading
 from typing import Any, Dict, List, Optional
 
 from pynput import keyboard
@@ -14,6 +15,7 @@ from linuxwhisper.managers.chat import ChatManager
 from linuxwhisper.managers.overlay import OverlayManager
 from linuxwhisper.services.audio import AudioService
 from linuxwhisper.services.clipboard import ClipboardService
+from linuxwhisper.services.image import ImageService
 from linuxwhisper.services.tts import TTSService
 from linuxwhisper.state import STATE
 
@@ -28,42 +30,73 @@ class KeyboardHandler:
         for mode_id, data in CFG.HOTKEY_DEFS.items()
     }
 
-    @classmethod
-    def check_key(cls, key, target_mode: str) -> bool:
-        """Check if pressed key matches target mode."""
-        valid_keys = cls.KEY_MAPPINGS.get(target_mode, [])
-        if key in valid_keys:
-            return True
-        if hasattr(key, 'vk') and key.vk in valid_keys:
-            return True
-        return False
+    # Reverse lookup: key or vk -> mode_id (earlier definitions win)
+    KEY_TO_MODE: Dict[Any, str] = {
+        k: mode_id
+        for mode_id, keys in reversed(list(KEY_MAPPINGS.items()))
+        for k in keys
+    }
+
+    # Work queue drained by a dedicated worker so listener callbacks return instantly
+    _evq: queue.Queue = queue.Queue()
 
     @classmethod
-    def get_mode_for_key(cls, key) -> Optional[str]:
-        """Get mode name for a pressed key, if any."""
-        for mode in CFG.MODES:
-            if cls.check_key(key, mode):
-                return mode
-        return None
+    def lookup_mode(cls, key) -> Optional[str]:
+        """Get mode bound to a key (by key object or vk), if any."""
+        mode = cls.KEY_TO_MODE.get(key)
+        if mode is None:
+            vk = getattr(key, 'vk', None)
+            if vk is not None:
+                mode = cls.KEY_TO_MODE.get(vk)
+        return mode
 
     @classmethod
     def on_press(cls, key) -> None:
-        """Handle key press events."""
+        """Listener callback: queue hotkey presses for the worker."""
+        # Hold mode ignores every press while recording (incl. auto-repeat)
+        if STATE.recording and not STATE.toggle_mode:
+            return
+        mode = cls.lookup_mode(key)
+        if mode:
+            cls._evq.put((cls._handle_press, (mode,)))
+
+    @classmethod
+    def on_release(cls, key) -> None:
+        """Listener callback: queue hotkey releases for the worker."""
+        # Recording state is checked in the worker: a quick tap's release can
+        # arrive before the queued press has started recording.
+        mode = cls.lookup_mode(key)
+        if mode:
+            cls._evq.put((cls._handle_release, (mode,)))
+
+    @classmethod
+    def _process_events(cls) -> None:
+        """Worker loop executing queued key events in order."""
+        while True:
+            fn, args = cls._evq.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"❌ Keyboard Error: {e}")
+
+    @classmethod
+    def _handle_press(cls, mode: str) -> None:
+        """Handle hotkey press for the given mode."""
         # Pin toggle (non-recording action)
-        if cls.check_key(key, "pin"):
+        if mode == "pin":
             if not STATE.recording:
                 ChatManager.toggle_pin()
             return
 
         # TTS toggle (non-recording action)
-        if cls.check_key(key, "tts"):
+        if mode == "tts":
             if not STATE.recording:
                 TTSService.toggle()
             return
 
         # Toggle mode: pressing same key again stops recording
         if STATE.recording and STATE.toggle_mode:
-            if cls.check_key(key, STATE.current_mode):
+            if mode == STATE.current_mode:
                 cls._stop_and_process()
             return
 
@@ -71,44 +104,50 @@ class KeyboardHandler:
             return
 
         # Check for recording mode keys
-        mode = cls.get_mode_for_key(key)
-        if mode:
+        if mode in CFG.MODES:
             STATE.current_mode = mode
 
-            # For rewrite mode, copy selected text first
+            # For rewrite mode, capture selected text first
             if mode == "ai_rewrite":
-                ClipboardService.copy_selected()
+                STATE.selected_text = ClipboardService.copy_selected()
 
             OverlayManager.show(mode)
             AudioService.start_recording()
 
     @classmethod
-    def on_release(cls, key) -> None:
-        """Handle key release events."""
+    def _handle_release(cls, mode: str) -> None:
+        """Handle hotkey release for the given mode."""
         if not STATE.recording:
             return
 
-        # In toggle mode, release does nothing (stop is handled in on_press)
+        # In toggle mode, release does nothing (stop is handled in _handle_press)
         if STATE.toggle_mode:
             return
 
         # Hold mode: release key stops recording
-        if cls.check_key(key, STATE.current_mode):
+        if mode == STATE.current_mode:
             cls._stop_and_process()
 
     @classmethod
     def _stop_and_process(cls) -> None:
         """Stop recording, transcribe, and process result."""
         OverlayManager.hide()
+        shot = None
+        if STATE.current_mode == "vision":
+            shot = ImageService.start_screenshot()  # Overlaps capture with transcription
         audio_data = AudioService.stop_recording()
 
-        if audio_data is not None:
-            transcribed = AudioService.transcribe(audio_data)
-            if transcribed:
-                ModeHandler.process(STATE.current_mode, transcribed)
+        try:
+            if audio_data is not None:
+                transcribed = AudioService.transcribe(audio_data)
+                if transcribed:
+                    ModeHandler.process(STATE.current_mode, transcribed)
+        finally:
+            ImageService.discard_screenshot(shot)  # No-op once the vision handler used it
 
     @classmethod
     def run(cls) -> None:
         """Start keyboard listener in current thread."""
+        threading.Thread(target=cls._process_events, daemon=True).start()
         with keyboard.Listener(on_press=cls.on_press, on_release=cls.on_release) as listener:
             listener.join()
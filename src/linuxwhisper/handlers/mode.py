@@ -3,81 +3,39 @@ Unified handler for all recording modes.
 """
 from __future__ import annotations
 
-import threading
+from typing import Callable, Dict
 
-import numpy as np
-import pyperclip
-
-from linuxwhisper.decorators import run_on_main_thread
 from linuxwhisper.managers.chat import ChatManager
 from linuxwhisper.managers.history import HistoryManager
-from linuxwhisper.managers.overlay import OverlayManager
 from linuxwhisper.services.ai import AIService
-from linuxwhisper.services.audio import AudioService
 from linuxwhisper.services.clipboard import ClipboardService
 from linuxwhisper.services.image import ImageService
 from linuxwhisper.services.tts import TTSService
 from linuxwhisper.state import STATE
 
-import gi
-gi.require_version('Gtk', '3.0')
-from gi.repository import GLib
+
+# --- Hallucination Guard ---
+# Whisper often outputs "Thank you", "You're welcome", or "Subtitle" on silence.
+_PUNCT_TBL = str.maketrans("", "", ".!?,;:")
+_HALLUCINATIONS = frozenset({"thank you", "you're welcome", "thanks", "subtitle", "untertitel", "you"})
 
 
 class ModeHandler:
     """Unified handler for all recording modes."""
 
-    @staticmethod
-    @run_on_main_thread
-    def stop_recording_safe() -> None:
-        """Safely stop recording and process (callable from any thread)."""
-        if not STATE.recording:
-            return
-
-        print("🛑 Voice Stop Triggered (Silence)")
-        OverlayManager.hide()
-        audio_data = AudioService.stop_recording()
-
-        if audio_data is not None:
-            # Process in background
-            threading.Thread(
-                target=ModeHandler._process_worker,
-                args=(STATE.current_mode, audio_data),
-                daemon=True
-            ).start()
-
-    @staticmethod
-    def _process_worker(mode: str, audio_data: np.ndarray) -> None:
-        """Worker thread for processing audio."""
-        transcribed = None
-        try:
-            transcribed = AudioService.transcribe(audio_data)
-        except Exception:
-            pass
-
-        if transcribed:
-            # Run processing (API calls etc)
-            GLib.idle_add(lambda: ModeHandler.process(mode, transcribed))
+    # Mode -> handler dispatch table, populated after the class body
+    _HANDLERS: Dict[str, Callable[[str], None]] = {}
 
     @staticmethod
     def process(mode: str, transcribed_text: str) -> None:
         """Route to appropriate handler based on mode."""
-        # --- Hallucination Guard ---
-        # Whisper often outputs "Thank you", "You're welcome", or "Subtitle" on silence.
-        # We filter these out to prevent weird loops.
-        clean = transcribed_text.strip().lower().replace(".", "").replace("!", "")
-        hallucinations = {"thank you", "you're welcome", "thanks", "subtitle", "untertitel", "you"}
-        if clean in hallucinations or len(clean) < 2:
+        # Filter out silence hallucinations to prevent weird loops
+        clean = transcribed_text.translate(_PUNCT_TBL).strip().lower()
+        if clean in _HALLUCINATIONS or len(clean) < 2:
             print(f"⚠️ Ignored Hallucination: '{transcribed_text}'")
             return
 
-        handlers = {
-            "dictation": ModeHandler._handle_dictation,
-            "ai": ModeHandler._handle_ai,
-            "ai_rewrite": ModeHandler._handle_ai_rewrite,
-            "vision": ModeHandler._handle_vision,
-        }
-        handler = handlers.get(mode)
+        handler = ModeHandler._HANDLERS.get(mode)
         if handler and transcribed_text:
             handler(transcribed_text)
 
@@ -110,7 +68,7 @@ class ModeHandler:
     @staticmethod
     def _handle_ai_rewrite(text: str) -> None:
         """Handle AI rewrite mode: rewrite selected text based on instruction."""
-        original = pyperclip.paste().strip()
+        original = STATE.selected_text
         prompt = (
             f"INSTRUCTION:\n{text}\n\n"
             f"ORIGINAL TEXT:\n{original}\n\n"
@@ -156,3 +114,11 @@ class ModeHandler:
 
         ClipboardService.type_text(response)
         TTSService.speak(response)
+
+
+ModeHandler._HANDLERS.update({
+    "dictation": ModeHandler._handle_dictation,
+    "ai": ModeHandler._handle_ai,
+    "ai_rewrite": ModeHandler._handle_ai_rewrite,
+    "vision": ModeHandler._handle_vision,
+})
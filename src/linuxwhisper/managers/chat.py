@@ -6,7 +6,6 @@ from __future__ import annotations
 from typing import Optional
 
 from linuxwhisper.config import CFG
-from linuxwhisper.decorators import run_on_main_thread
 from linuxwhisper.state import STATE
 
 import gi
@@ -17,15 +16,14 @@ from gi.repository import GLib
 class ChatManager:
     """Manages chat overlay state and messages."""
 
+    # Coalescing state: at most one pending refresh per main-loop tick
+    _refresh_pending: bool = False
+    _refresh_status: Optional[str] = None
+
     @staticmethod
     def add_message(role: str, text: str) -> None:
-        """Add message to chat overlay."""
+        """Add message to chat overlay (oldest dropped beyond limit)."""
         STATE.chat_messages.append({"role": role, "text": text})
-
-        # Trim to limit
-        if len(STATE.chat_messages) > CFG.CHAT_MESSAGE_LIMIT:
-            STATE.chat_messages = STATE.chat_messages[-CFG.CHAT_MESSAGE_LIMIT:]
-
         ChatManager.refresh_overlay()
 
     @staticmethod
@@ -43,10 +41,20 @@ class ChatManager:
             ChatManager.refresh_overlay()
 
     @staticmethod
-    @run_on_main_thread
     def refresh_overlay(status_text: Optional[str] = None) -> None:
-        """Refresh chat overlay on main thread."""
-        ChatManager._show_overlay(status_text)
+        """Schedule a chat overlay refresh on main thread (coalesced)."""
+        ChatManager._refresh_status = status_text
+        if ChatManager._refresh_pending:
+            return
+        ChatManager._refresh_pending = True
+        GLib.idle_add(ChatManager._do_refresh)
+
+    @staticmethod
+    def _do_refresh() -> bool:
+        """Idle callback running the pending refresh."""
+        ChatManager._refresh_pending = False
+        ChatManager._show_overlay(ChatManager._refresh_status)
+        return False
 
     @staticmethod
     def _show_overlay(status_text: Optional[str] = None) -> None:
@@ -3,16 +3,30 @@ Conversation and answer history management.
 """
 from __future__ import annotations
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 from linuxwhisper.config import CFG
+from linuxwhisper.decorators import safe_execute
+from linuxwhisper.services.ai import AIService
 from linuxwhisper.state import STATE
 
+# Background summarization of turns beyond CFG.HISTORY_MAX_TURNS
+_SUMMARIZER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summarize")
+
+# Guards conversation_history, history_tokens, history_token_count and
+# history_summary (mode worker, summarizer and GTK thread all mutate them)
+_LOCK = threading.RLock()
+
 
 class HistoryManager:
     """Manages conversation and answer history."""
 
+    _summary_pending: bool = False
+    _generation: int = 0  # Bumped by clear_all; stale summaries are dropped
+
     @staticmethod
     def estimate_tokens(text: str) -> int:
         """Rough token estimate (~4 chars per token)."""
@@ -20,34 +34,82 @@ class HistoryManager:
 
     @staticmethod
     def get_history_tokens() -> int:
-        """Calculate total tokens in conversation history."""
-        return sum(
-            HistoryManager.estimate_tokens(msg["content"])
-            for msg in STATE.conversation_history
-        )
+        """Return total tokens in conversation history (running count)."""
+        return STATE.history_token_count
 
     @staticmethod
     def trim_history() -> None:
         """Remove oldest messages until under token limit."""
-        while (HistoryManager.get_history_tokens() > CFG.MAX_TOKENS
-               and STATE.conversation_history):
+        with _LOCK:
+            HistoryManager._trim_locked()
+
+    @staticmethod
+    def _trim_locked() -> None:
+        """trim_history body; caller holds _LOCK."""
+        while STATE.history_token_count > CFG.MAX_TOKENS and STATE.conversation_history:
             STATE.conversation_history.pop(0)
+            STATE.history_token_count -= STATE.history_tokens.pop(0)
 
     @staticmethod
     def add_message(role: str, content: str) -> None:
         """Add message to conversation history and trim if needed."""
-        STATE.conversation_history.append({"role": role, "content": content})
-        HistoryManager.trim_history()
+        tokens = len(content) >> 2  # Inlined estimate_tokens (~4 chars per token)
+        with _LOCK:
+            STATE.conversation_history.append({"role": role, "content": content})
+            STATE.history_tokens.append(tokens)
+            STATE.history_token_count += tokens
+            HistoryManager._trim_locked()
+
+            # Hysteresis: fold a batch of turns at 2x the window, not one per turn
+            if (len(STATE.conversation_history) > 2 * CFG.HISTORY_MAX_TURNS
+                    and not HistoryManager._summary_pending):
+                HistoryManager._summary_pending = True
+                _SUMMARIZER.submit(HistoryManager._compress_old_history)
+
+    @staticmethod
+    @safe_execute("History Summary")
+    def _compress_old_history() -> None:
+        """Fold turns beyond HISTORY_MAX_TURNS into STATE.history_summary."""
+        try:
+            with _LOCK:
+                overflow = STATE.conversation_history[:-CFG.HISTORY_MAX_TURNS]
+                previous = STATE.history_summary
+                generation = HistoryManager._generation
+            if not overflow:
+                return
+
+            # Network call outside the lock; only the result is applied under it
+            summary = AIService.summarize(previous, overflow)
+            if not summary:
+                return
+
+            with _LOCK:
+                if HistoryManager._generation != generation:
+                    return  # History was cleared meanwhile
+                # Only front pops (trim) happened since the snapshot: skip what is gone
+                history = STATE.conversation_history
+                head = history[0] if history else None
+                gone = next((i for i, m in enumerate(overflow) if m is head), len(overflow))
+                for _ in range(len(overflow) - gone):
+                    history.pop(0)
+                    STATE.history_token_count -= STATE.history_tokens.pop(0)
+                STATE.history_summary = summary.strip()
+        finally:
+            HistoryManager._summary_pending = False
 
     @staticmethod
     def add_answer(text: str) -> None:
-        """Add answer to tray history."""
+        """Add answer to tray history (oldest dropped beyond limit)."""
         timestamp = time.strftime("%H:%M")
-        STATE.answer_history.insert(0, {"text": text, "timestamp": timestamp})
-
-        # Trim to limit
-        if len(STATE.answer_history) > CFG.ANSWER_HISTORY_LIMIT:
-            STATE.answer_history = STATE.answer_history[:CFG.ANSWER_HISTORY_LIMIT]
+        # Tray label computed once here; entries never change after insertion
+        preview = text[:50].replace("\n", " ")
+        if len(text) > 50:
+            preview += "..."
+        STATE.answer_history.appendleft({
+            "text": text,
+            "timestamp": timestamp,
+            "label": f"[{timestamp}] {preview}",
+        })
 
         # Late import to avoid circular dependency
         from linuxwhisper.ui.tray import TrayManager
@@ -56,9 +118,14 @@ class HistoryManager:
     @staticmethod
     def clear_all() -> None:
         """Clear all history."""
-        STATE.answer_history = []
-        STATE.conversation_history = []
-        STATE.chat_messages = []
+        STATE.answer_history.clear()
+        with _LOCK:
+            HistoryManager._generation += 1
+            STATE.conversation_history = []
+            STATE.history_tokens = []
+            STATE.history_token_count = 0
+            STATE.history_summary = ""
+        STATE.chat_messages.clear()
         # Late imports to avoid circular dependencies
         from linuxwhisper.ui.tray import TrayManager
         from linuxwhisper.managers.chat import ChatManager
@@ -10,6 +10,9 @@ from linuxwhisper.config import CFG
 from linuxwhisper.decorators import safe_execute
 from linuxwhisper.state import STATE
 
+# Shared, read-only system message (the SDK does not mutate message dicts)
+_SYSTEM_MSG: Dict[str, str] = {"role": "system", "content": CFG.SYSTEM_PROMPT}
+
 
 class AIService:
     """AI chat and vision completion service."""
@@ -17,10 +20,17 @@ class AIService:
     @staticmethod
     def build_messages(user_content: str) -> List[Dict[str, Any]]:
         """Build API messages with system prompt and conversation history."""
-        messages = [{"role": "system", "content": CFG.SYSTEM_PROMPT}]
-        messages.extend(STATE.conversation_history)
-        messages.append({"role": "user", "content": user_content})
-        return messages
+        summary = (
+            [{"role": "system", "content": f"Summary of the earlier conversation:\n{STATE.history_summary}"}]
+            if STATE.history_summary else []
+        )
+        # Single list display: sized once instead of growing via append/extend
+        return [
+            _SYSTEM_MSG,
+            *summary,
+            *STATE.conversation_history,  # Older turns are popped once folded into the summary
+            {"role": "user", "content": user_content},
+        ]
 
     @staticmethod
     @safe_execute("AI Chat")
@@ -43,7 +53,7 @@ class AIService:
             "role": "user",
             "content": [
                 {"type": "text", "text": prompt},
-                {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{image_base64}"}}
+                {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{image_base64}"}}
             ]
         }
         response = GROQ_CLIENT.chat.completions.create(
@@ -51,3 +61,22 @@ class AIService:
             messages=messages
         )
         return response.choices[0].message.content
+
+    @staticmethod
+    @safe_execute("AI Summary")
+    def summarize(previous_summary: str, messages: List[Dict[str, str]]) -> Optional[str]:
+        """Fold older conversation turns into a short rolling summary."""
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        prompt = (
+            f"PREVIOUS SUMMARY:\n{previous_summary or '(none)'}\n\n"
+            f"NEW TURNS:\n{transcript}\n\n"
+            "Update the summary to cover the previous summary and the new turns. "
+            "Keep facts, names and open questions. Output ONLY the summary."
+        )
+        response = GROQ_CLIENT.chat.completions.create(
+            model=CFG.MODEL_FAST,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0,
+            max_tokens=CFG.SUMMARY_MAX_TOKENS
+        )
+        return response.choices[0].message.content
@@ -4,49 +4,80 @@ Audio recording and transcription service.
 from __future__ import annotations
 
 import io
-import queue
+import struct
+import threading
 from typing import Any, Optional
 
 import numpy as np
 import sounddevice as sd
-from scipy.io.wavfile import write as wav_write
 
 from linuxwhisper.api import GROQ_CLIENT
 from linuxwhisper.config import CFG
 from linuxwhisper.decorators import safe_execute
 from linuxwhisper.state import STATE
 
+# RIFF/WAVE header for mono 16-bit PCM (44 bytes)
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
 
 class AudioService:
     """Audio recording and transcription service."""
 
+    # Visualization runs off the realtime audio thread
+    VIZ_WINDOW: int = 4096  # Newest samples per visualization frame
+    VIZ_DECIMATE: int = 10
+    _viz_event = threading.Event()
+    _viz_thread: Optional[threading.Thread] = None
+
     @staticmethod
     def audio_callback(indata: np.ndarray, frames: int, time_info: Any, status: Any) -> None:
         """Capture audio chunks into buffer while recording."""
         if not STATE.recording:
             return
 
-        data_copy = indata.copy()
-
-        STATE.audio_buffer.append(data_copy)
+        # Write straight into the preallocated buffer (drops audio past MAX_RECORD_SEC)
+        ring = STATE.audio_ring
+        start = STATE.audio_write_idx
+        end = min(start + frames, ring.size)
+        ring[start:end] = indata[:end - start, 0]
+        STATE.audio_write_idx = end
+        AudioService._viz_event.set()
 
-        # Send downsampled data to visualization queue (skip if full)
-        try:
-            if STATE.viz_queue.qsize() < 5:
-                flat_data = data_copy[:, 0][::10]  # Downsample
-                STATE.viz_queue.put_nowait(flat_data)
-        except Exception:
-            pass
+    @staticmethod
+    def _viz_worker() -> None:
+        """Downsample the newest audio into the visualization slot."""
+        step = AudioService.VIZ_DECIMATE
+        while True:
+            AudioService._viz_event.wait()
+            AudioService._viz_event.clear()
+            if not STATE.recording:
+                continue
+            end = STATE.audio_write_idx
+            window = STATE.audio_ring[max(0, end - AudioService.VIZ_WINDOW):end]
+            usable = len(window) - len(window) % step
+            if usable:
+                # Peak envelope per group, matching the overlay's amplitude bars
+                peaks = np.abs(window[:usable]).reshape(-1, step).max(axis=1)
+                STATE.viz_latest.append(peaks)  # Replaces any undrawn frame
+                STATE.viz_dirty = True
 
     @staticmethod
     def start_recording() -> None:
         """Start audio recording stream."""
-        STATE.audio_buffer = []
-        AudioService._clear_viz_queue()
+        # Fresh buffer per recording: pages are committed lazily, and a previous
+        # recording may still be referenced by a pending transcription.
+        STATE.audio_ring = np.empty(CFG.SAMPLE_RATE * CFG.MAX_RECORD_SEC, dtype=np.float32)
+        STATE.audio_write_idx = 0
+        STATE.viz_latest.clear()
+        if AudioService._viz_thread is None:
+            AudioService._viz_thread = threading.Thread(target=AudioService._viz_worker, daemon=True)
+            AudioService._viz_thread.start()
         STATE.stream = sd.InputStream(
             samplerate=CFG.SAMPLE_RATE,
             channels=1,
             dtype='float32',
+            blocksize=CFG.AUDIO_BLOCKSIZE,
+            latency='low',
             callback=AudioService.audio_callback
         )
         STATE.stream.start()
@@ -61,27 +92,40 @@ class AudioService:
             STATE.stream.close()
             STATE.stream = None
 
-        if STATE.audio_buffer:
-            return np.concatenate(STATE.audio_buffer, axis=0)
+        if STATE.audio_ring is not None and STATE.audio_write_idx:
+            return STATE.audio_ring[:STATE.audio_write_idx]
         return None
 
     @staticmethod
-    def _clear_viz_queue() -> None:
-        """Clear the visualization queue."""
-        while not STATE.viz_queue.empty():
-            try:
-                STATE.viz_queue.get_nowait()
-            except queue.Empty:
-                break
+    def encode_wav(audio_data: np.ndarray) -> io.BytesIO:
+        """Encode float32 samples as a mono 16-bit PCM WAV file object."""
+        samples = audio_data.reshape(-1)
+        data_size = samples.size * 2
+        total = _WAV_HEADER.size + data_size
+
+        # Grow the BytesIO's own buffer once, then encode into it in place
+        wav = io.BytesIO()
+        wav.seek(total - 1)
+        wav.write(b'\0')
+        with wav.getbuffer() as view:
+            _WAV_HEADER.pack_into(
+                view, 0,
+                b'RIFF', 36 + data_size, b'WAVE', b'fmt ', 16,
+                1, 1, CFG.SAMPLE_RATE, CFG.SAMPLE_RATE * 2, 2, 16,
+                b'data', data_size
+            )
+            pcm = np.frombuffer(view, dtype='<i2', offset=_WAV_HEADER.size)
+            pcm[:] = np.clip(samples, -1.0, 1.0) * 32767
+            del pcm  # Release the buffer export before the view closes
+        wav.seek(0)
+        return wav
 
     @staticmethod
     @safe_execute("Transcription")
     def transcribe(audio_data: np.ndarray) -> Optional[str]:
         """Transcribe audio using Groq Whisper."""
-        wav_buffer = io.BytesIO()
+        wav_buffer = AudioService.encode_wav(audio_data)
         wav_buffer.name = "audio.wav"
-        wav_write(wav_buffer, CFG.SAMPLE_RATE, audio_data)
-        wav_buffer.seek(0)
 
         transcript = GROQ_CLIENT.audio.transcriptions.create(
             model=CFG.MODEL_WHISPER,
@@ -6,10 +6,16 @@ Detects terminal emulators and uses the correct keyboard shortcuts
 """
 from __future__ import annotations
 
+import re
 import subprocess
+import threading
 import time
+from typing import Any, List, Optional
 
 import pyperclip
+from Xlib import X, XK
+from Xlib import display as xdisplay
+from Xlib.ext import xtest
 
 # Substrings to match against WM_CLASS (lowercase).
 # Covers namespaced names like "com.mitchellh.ghostty".
@@ -19,10 +25,25 @@ _TERMINAL_KEYWORDS = (
     "guake", "tilda", "yakuake", "wezterm", "foot",
     "cool-retro-term", "hyper", "tabby", "rio", "ghostty",
 )
+_TERMINAL_RE = re.compile("|".join(map(re.escape, _TERMINAL_KEYWORDS)))
+
+# Reuse a detection result briefly: focus doesn't change within one action
+_TERMINAL_CACHE_SEC = 0.5
+_terminal_cache = [0.0, False]  # [monotonic timestamp, result]
 
 
 def _is_terminal_focused() -> bool:
-    """Check if the currently focused window is a terminal emulator."""
+    """Check if the focused window is a terminal emulator (cached briefly)."""
+    now = time.monotonic()
+    if now - _terminal_cache[0] < _TERMINAL_CACHE_SEC:
+        return _terminal_cache[1]
+    result = _detect_terminal_focused()
+    _terminal_cache[:] = [now, result]
+    return result
+
+
+def _detect_terminal_focused() -> bool:
+    """Query X11 for whether the focused window is a terminal emulator."""
     try:
         # Get active window ID
         win_id = subprocess.run(
@@ -37,12 +58,71 @@ def _is_terminal_focused() -> bool:
             ["xprop", "-id", win_id, "WM_CLASS"],
             capture_output=True, text=True, timeout=1,
         )
-        wm_class = result.stdout.strip().lower()
-        return any(kw in wm_class for kw in _TERMINAL_KEYWORDS)
+        return _TERMINAL_RE.search(result.stdout.lower()) is not None
     except Exception:
         return False
 
 
+# Placeholder put on the clipboard to detect when a copy has landed
+_COPY_SENTINEL = "__linuxwhisper_copy_pending__"
+_COPY_POLL_SEC = 0.01
+_COPY_TIMEOUT_SEC = 0.2
+
+# Persistent X connection for XTEST key injection (not thread-safe: guard with lock)
+_MODIFIER_KEYSYMS = {"ctrl": "Control_L", "shift": "Shift_L", "alt": "Alt_L", "super": "Super_L"}
+_x_lock = threading.Lock()
+_x_display: Optional[Any] = None
+
+
+def _combo_keycodes(display: Any, key: str) -> List[int]:
+    """Resolve a combo like "ctrl+shift+v" to X keycodes."""
+    codes = []
+    for part in key.split("+"):
+        keysym = XK.string_to_keysym(_MODIFIER_KEYSYMS.get(part, part))
+        code = display.keysym_to_keycode(keysym)
+        if not code:
+            raise ValueError(f"No keycode for '{part}'")
+        codes.append(code)
+    return codes
+
+
+def _send_key(key: str, settle: float = 0.0) -> None:
+    """Send a key combo via XTEST, falling back to xdotool."""
+    global _x_display
+    with _x_lock:
+        held = 0  # Leading keys of the combo currently pressed
+        try:
+            if _x_display is None:
+                _x_display = xdisplay.Display()
+            codes = _combo_keycodes(_x_display, key)
+            for code in codes:
+                xtest.fake_input(_x_display, X.KeyPress, code)
+                held += 1
+            for code in reversed(codes):
+                xtest.fake_input(_x_display, X.KeyRelease, code)
+                held -= 1
+            _x_display.sync()
+            failed = False
+        except Exception:
+            failed = True
+            if held:  # Don't leave modifiers stuck down before retrying the combo
+                subprocess.run(["xdotool", "keyup", "+".join(key.split("+")[:held])])
+            if _x_display is not None:
+                try:
+                    _x_display.close()
+                except Exception:
+                    pass
+                _x_display = None
+
+    if failed:
+        cmd = ["xdotool", "key", key]
+        if settle:
+            cmd += ["sleep", str(settle)]
+        subprocess.run(cmd)
+        return
+    if settle:
+        time.sleep(settle)
+
 class ClipboardService:
     """Clipboard operations for typing and pasting text."""
 
@@ -64,10 +144,9 @@ class ClipboardService:
         # Paste via clipboard – use correct shortcut for terminals
         pyperclip.copy(clean_text)
         paste_key = "ctrl+shift+v" if _is_terminal_focused() else "ctrl+v"
-        subprocess.run(["xdotool", "key", paste_key])
+        _send_key(paste_key, settle=0.1)
 
-        # Restore original clipboard after short delay
-        time.sleep(0.1)
+        # Restore original clipboard once the paste has landed
         if original is not None:
             try:
                 pyperclip.copy(original)
@@ -76,15 +155,36 @@ class ClipboardService:
 
     @staticmethod
     def copy_selected() -> str:
-        """Copy currently selected text and return it."""
+        """Copy currently selected text and return it ("" if nothing was copied)."""
+        try:
+            original = pyperclip.paste()
+        except Exception:
+            original = None
+
+        # Non-text content (images, files) reads as "": leave it in place and
+        # wait for any text instead, since it cannot be restored via pyperclip
+        pending = _COPY_SENTINEL if original else ""
+        if pending:
+            pyperclip.copy(pending)
         copy_key = "ctrl+shift+c" if _is_terminal_focused() else "ctrl+c"
-        subprocess.run(["xdotool", "key", copy_key])
-        time.sleep(0.1)
-        return pyperclip.paste().strip()
+        _send_key(copy_key)
+
+        # Return as soon as the clipboard owner changes instead of a fixed wait
+        deadline = time.monotonic() + _COPY_TIMEOUT_SEC
+        while time.monotonic() < deadline:
+            time.sleep(_COPY_POLL_SEC)
+            value = pyperclip.paste()
+            if value != pending:
+                return value.strip()
+
+        # Nothing selected: put the user's text clipboard back
+        if pending:
+            pyperclip.copy(original)
+        return ""
 
     @staticmethod
     def paste_text(text: str) -> None:
         """Paste text directly via clipboard."""
         pyperclip.copy(text)
         paste_key = "ctrl+shift+v" if _is_terminal_focused() else "ctrl+v"
-        subprocess.run(["xdotool", "key", paste_key])
+        _send_key(paste_key)
@@ -4,23 +4,90 @@ Screenshot and image encoding service.
 from __future__ import annotations
 
 import base64
-import os
-import subprocess
-from typing import Optional
+import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+import mss
+from PIL import Image
 
 from linuxwhisper.config import CFG
 from linuxwhisper.decorators import safe_execute
 
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import GLib
+
+
+# Grabs run here so a slow capture never stalls the GTK main loop
+_GRABBER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot")
+_LOCK = threading.Lock()
+
 
 class ImageService:
     """Screenshot and image encoding service."""
 
+    # Grab started ahead of time by start_screenshot, consumed by take_screenshot
+    _pending: Optional[Future] = None
+
+    @staticmethod
+    def _grab() -> Any:
+        """Grab the whole desktop (all monitors) as raw BGRA pixels."""
+        with mss.mss() as sct:
+            return sct.grab(sct.monitors[0])
+
+    @staticmethod
+    def _run_grab(future: Future) -> None:
+        """Worker: fill the request's future with a fresh grab."""
+        try:
+            future.set_result(ImageService._grab())
+        except Exception as e:
+            future.set_exception(e)
+
+    @staticmethod
+    def _submit_grab(future: Future) -> bool:
+        """Idle callback: hand the grab to the worker unless already discarded."""
+        if future.set_running_or_notify_cancel():
+            _GRABBER.submit(ImageService._run_grab, future)
+        return False
+
+    @staticmethod
+    def start_screenshot() -> Future:
+        """Start a grab for this request; encode later in take_screenshot."""
+        future: Future = Future()
+        with _LOCK:
+            stale, ImageService._pending = ImageService._pending, future
+        if stale is not None:
+            stale.cancel()
+        # Queued after a pending overlay hide so the overlay is not captured
+        GLib.idle_add(ImageService._submit_grab, future)
+        return future
+
+    @staticmethod
+    def discard_screenshot(future: Optional[Future]) -> None:
+        """Drop an early grab the vision path did not consume."""
+        if future is None:
+            return
+        with _LOCK:
+            if ImageService._pending is future:
+                ImageService._pending = None
+        future.cancel()
+
     @staticmethod
     @safe_execute("Screenshot")
     def take_screenshot() -> Optional[str]:
-        """Take screenshot and return base64 encoded string."""
-        subprocess.run(["gnome-screenshot", "-f", CFG.TEMP_SCREEN_PATH])
-        with open(CFG.TEMP_SCREEN_PATH, "rb") as f:
-            encoded = base64.b64encode(f.read()).decode('utf-8')
-        os.remove(CFG.TEMP_SCREEN_PATH)
-        return encoded
+        """Downscale the early grab (or grab now) and return base64 encoded JPEG."""
+        with _LOCK:
+            future, ImageService._pending = ImageService._pending, None
+        if future is None or future.cancel():  # None started yet: grab here instead
+            shot = ImageService._grab()
+        else:
+            shot = future.result()
+        img = Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+        # Larger images only cost upload time and vision tokens
+        img.thumbnail((CFG.VISION_MAX_DIM, CFG.VISION_MAX_DIM), Image.BILINEAR)
+        buf = io.BytesIO()
+        img.save(buf, format="JPEG", quality=CFG.VISION_JPEG_QUALITY)
+        with buf.getbuffer() as view:  # Encode without copying the JPEG bytes out
+            return base64.b64encode(view).decode('ascii')
@@ -3,8 +3,10 @@ Text-to-speech service using Groq Orpheus.
 """
 from __future__ import annotations
 
+import queue
 import subprocess
 import threading
+from typing import Optional
 
 from linuxwhisper.api import GROQ_CLIENT
 from linuxwhisper.config import CFG
@@ -14,26 +16,59 @@ from linuxwhisper.state import STATE
 class TTSService:
     """Text-to-speech service using Groq Orpheus."""
 
+    # Single playback worker: utterances never overlap
+    _queue: queue.Queue = queue.Queue()
+    _worker: Optional[threading.Thread] = None
+    _worker_lock = threading.Lock()
+
     @staticmethod
     def speak(text: str) -> None:
-        """Convert text to speech and play (async)."""
+        """Queue text for speech playback (async)."""
         if not STATE.tts_enabled or not text:
             return
 
-        def _speak_thread():
+        with TTSService._worker_lock:
+            if TTSService._worker is None:
+                TTSService._worker = threading.Thread(target=TTSService._run_worker, daemon=True)
+                TTSService._worker.start()
+        TTSService._queue.put(text)
+
+    @staticmethod
+    def _run_worker() -> None:
+        """Play queued utterances in order, merging any that piled up."""
+        while True:
+            parts = [TTSService._queue.get()]
+            while True:
+                try:
+                    parts.append(TTSService._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if STATE.tts_enabled:
+                TTSService._play(" ".join(parts))
+
+    @staticmethod
+    def _play(text: str) -> None:
+        """Synthesize text and stream it to aplay (blocking)."""
+        try:
+            # Start the player first so its startup overlaps synthesis
+            player = subprocess.Popen(
+                ["aplay", "-q", "-t", "wav", "-"],
+                stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
             try:
-                response = GROQ_CLIENT.audio.speech.create(
+                with GROQ_CLIENT.audio.speech.with_streaming_response.create(
                     model=CFG.MODEL_TTS,
                     voice=STATE.tts_voice,
                     input=text[:CFG.TTS_MAX_CHARS],
                     response_format="wav"
-                )
-                response.write_to_file(CFG.TEMP_TTS_PATH)
-                subprocess.run(["aplay", "-q", CFG.TEMP_TTS_PATH], capture_output=True)
-            except Exception as e:
-                print(f"❌ TTS Error: {e}")
-
-        threading.Thread(target=_speak_thread, daemon=True).start()
+                ) as response:
+                    for chunk in response.iter_bytes(4096):
+                        player.stdin.write(chunk)
+            finally:
+                player.stdin.close()
+                player.wait()
+        except Exception as e:
+            print(f"❌ TTS Error: {e}")
 
     @staticmethod
     def toggle() -> None:
@@ -4,9 +4,9 @@ Mutable application state and settings persistence.
 from __future__ import annotations
 
 import json
-import queue
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import numpy as np
 import sounddevice as sd
@@ -17,7 +17,7 @@ import gi
 gi.require_version('AyatanaAppIndicator3', '0.1')
 gi.require_version('Gtk', '3.0')
 from gi.repository import AyatanaAppIndicator3 as AppIndicator
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 
 
 # ---------------------------------------------------------------------------
@@ -26,23 +26,26 @@ from gi.repository import Gtk
 class SettingsManager:
     """Handles persistence of user settings."""
 
+    _last_written: Optional[str] = None  # Serialized settings last read or written
+    _save_timer: Optional[int] = None  # Pending save_debounced timeout
+
     @staticmethod
     def load() -> Dict[str, Any]:
         """Load settings from JSON file."""
         if not CFG.SETTINGS_FILE.exists():
             return {}
         try:
-            with open(CFG.SETTINGS_FILE, "r") as f:
-                return json.load(f)
+            text = CFG.SETTINGS_FILE.read_text()
+            SettingsManager._last_written = text
+            return json.loads(text)
         except Exception as e:
             print(f"⚠️ Failed to load settings: {e}")
             return {}
 
     @staticmethod
     def save(state: "AppState") -> None:
-        """Save current relevant state to JSON file."""
+        """Save current relevant state to JSON file (skipped if unchanged)."""
         try:
-            CFG.SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
             data = {
                 "color_scheme": state.color_scheme,
                 "tts_voice": state.tts_voice,
@@ -51,11 +54,36 @@ class SettingsManager:
                 "chat_enabled": state.chat_enabled,
                 "toggle_mode": state.toggle_mode,
             }
-            with open(CFG.SETTINGS_FILE, "w") as f:
-                json.dump(data, f, indent=4)
+            text = json.dumps(data, indent=4)
+            if text == SettingsManager._last_written:
+                return
+            CFG.SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            CFG.SETTINGS_FILE.write_text(text)
+            SettingsManager._last_written = text
         except Exception as e:
             print(f"⚠️ Failed to save settings: {e}")
 
+    @staticmethod
+    def save_debounced(state: "AppState", delay_ms: int = 500) -> None:
+        """Save once no further change arrives within delay_ms (GTK thread)."""
+        if SettingsManager._save_timer:
+            GLib.source_remove(SettingsManager._save_timer)
+        SettingsManager._save_timer = GLib.timeout_add(delay_ms, SettingsManager._flush_timer, state)
+
+    @staticmethod
+    def _flush_timer(state: "AppState") -> bool:
+        """Timer callback for save_debounced."""
+        SettingsManager._save_timer = None
+        SettingsManager.save(state)
+        return False
+
+    @staticmethod
+    def flush(state: "AppState") -> None:
+        """Write a pending debounced save immediately."""
+        if SettingsManager._save_timer:
+            GLib.source_remove(SettingsManager._save_timer)
+            SettingsManager._flush_timer(state)
+
 
 # ---------------------------------------------------------------------------
 # Runtime state
@@ -71,23 +99,32 @@ class AppState:
     # --- Recording State ---
     recording: bool = False
     current_mode: Optional[str] = None
-    audio_buffer: List[np.ndarray] = field(default_factory=list)
+    audio_ring: Optional[np.ndarray] = None  # Preallocated mono capture buffer
+    audio_write_idx: int = 0
     stream: Optional[sd.InputStream] = None
-    viz_queue: queue.Queue = field(default_factory=queue.Queue)
+    viz_latest: Deque[np.ndarray] = field(
+        default_factory=lambda: deque(maxlen=1))  # Newest waveform frame only
+    viz_dirty: bool = False  # Set when viz_latest holds an undrawn frame
+    selected_text: str = ""  # Selection captured when rewrite recording starts
 
     # --- UI Windows ---
     overlay_window: Optional[Any] = None   # GtkOverlay instance
     chat_overlay_window: Optional[Any] = None  # ChatOverlay instance
 
     # --- Chat State ---
-    chat_messages: List[Dict[str, str]] = field(default_factory=list)
+    chat_messages: Deque[Dict[str, str]] = field(
+        default_factory=lambda: deque(maxlen=CFG.CHAT_MESSAGE_LIMIT))
     chat_pinned: bool = False
     chat_enabled: bool = True
     chat_hide_timer: Optional[int] = None
 
     # --- History ---
     conversation_history: List[Dict[str, str]] = field(default_factory=list)
-    answer_history: List[Dict[str, str]] = field(default_factory=list)
+    history_tokens: List[int] = field(default_factory=list)  # Per-message estimates, parallel to conversation_history
+    history_token_count: int = 0  # Running sum of history_tokens
+    history_summary: str = ""  # Rolling summary of turns dropped from conversation_history
+    answer_history: Deque[Dict[str, str]] = field(
+        default_factory=lambda: deque(maxlen=CFG.ANSWER_HISTORY_LIMIT))  # Newest first
 
     # --- TTS ---
     tts_enabled: bool = False  # Disabled by default
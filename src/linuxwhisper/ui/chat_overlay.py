@@ -3,16 +3,17 @@ Chat overlay using WebKit2 with HTML/CSS/JS rendering.
 """
 from __future__ import annotations
 
-import html as html_lib
+import functools
 import json
 import re
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import cairo
 import pyperclip
 
 from linuxwhisper.config import CFG
 from linuxwhisper.state import STATE
+from linuxwhisper.ui.colors import parse_hex
 
 import gi
 gi.require_version('Gtk', '3.0')
@@ -44,9 +45,7 @@ html, body {{
   display: flex; 
   flex-direction: column;
   height: 100%;
-  background-color: {bg_rgba};
-  backdrop-filter: blur(16px);
-  -webkit-backdrop-filter: blur(16px);
+  background-color: {bg_rgba}; /* Near-opaque; no backdrop blur (CPU-rendered in WebKitGTK) */
   border-radius: 20px;
   border: 1px solid {accent_alpha20}; /* Accent border */
   box-shadow: 0 8px 32px {black_alpha40};
@@ -123,10 +122,6 @@ html, body {{
   border-radius: 14px;
   position: relative;
   word-wrap: break-word;
-  /* Force hardware acceleration and stabilization */
-  transform: translateZ(0);
-  backface-visibility: hidden;
-  -webkit-backface-visibility: hidden;
 }}
 
 /* User Bubble - Surface Color */
@@ -194,7 +189,6 @@ html, body {{
   display: flex;
   align-items: center;
   justify-content: center;
-  backdrop-filter: blur(4px);
 }}
 .code-block-wrapper:hover .code-copy-btn {{ opacity: 1; }}
 .code-copy-btn:hover {{ background: {selection_alpha90}; color: {white}; transform: scale(1.05); }}
@@ -212,7 +206,10 @@ CHAT_JS = '''
 const copyIcon = '<svg viewBox="0 0 24 24"><path d="M16 1H4c-1.1 0-2 .9-2 2v14h2V3h12V1zm3 4H8c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h11c1.1 0 2-.9 2-2V7c0-1.1-.9-2-2-2zm0 16H8V7h11v14z"/></svg>';
 const checkIcon = '<svg viewBox="0 0 24 24"><path d="M9 16.17L4.83 12l-1.42 1.41L9 19 21 7l-1.41-1.41z"/></svg>';
 
-function copyText(btn, index) {
+function copyText(btn) {
+  // Index among rendered messages (the DOM mirrors Python's rendered list)
+  const wrappers = Array.from(document.querySelectorAll('#chat .message-wrapper'));
+  const index = wrappers.indexOf(btn.parentElement);
   // Use custom protocol to let Python handle clipboard safely
   window.location.href = "copy://" + index;
   
@@ -243,57 +240,175 @@ function copyCode(btn) {
   setTimeout(() => { btn.innerHTML = copyIcon; btn.classList.remove('copied'); }, 1500);
 }
 
-// Scroll Logic: Improved to handle reloads and dynamic content
-function checkScroll(smooth=true) {
-  const scrollArea = document.getElementById('scroll-area');
-  if (!scrollArea) return;
-  
-  const scrollToBottom = () => {
-    scrollArea.scrollTo({ 
-      top: scrollArea.scrollHeight, 
-      behavior: smooth ? 'smooth' : 'auto' 
-    });
-  };
-
-  // Immediate scroll
-  scrollToBottom();
-  
-  // Backup scrolls to account for rendering delays and images
-  requestAnimationFrame(scrollToBottom);
-  setTimeout(scrollToBottom, 50);
-  setTimeout(scrollToBottom, 250);
+// Incremental updates driven from Python via run_javascript
+window.lw = {
+  appendMessages(htmls) {
+    // Build all nodes off-document, then insert them with a single layout
+    const frag = document.createDocumentFragment();
+    const tpl = document.createElement('template');
+    for (const html of htmls) {
+      tpl.innerHTML = html;
+      frag.appendChild(tpl.content.firstElementChild);
+    }
+    const status = document.getElementById('status');
+    status.parentNode.insertBefore(frag, status);
+  },
+  dropFirst(count) {
+    const wrappers = document.querySelectorAll('#chat .message-wrapper');
+    for (let i = 0; i < count && i < wrappers.length; i++) wrappers[i].remove();
+  },
+  setMessages(htmls) {
+    document.querySelectorAll('#chat .message-wrapper').forEach(el => el.remove());
+    window.lw.appendMessages(htmls);
+  },
+  setStatus(html) {
+    const status = document.getElementById('status');
+    status.innerHTML = html;
+    status.hidden = !html;
+  },
+  setPinHint(html) {
+    document.getElementById('pin-hint').innerHTML = html;
+  }
+};
+
+// Scroll Logic: at most one scroll to the bottom per animation frame
+let scrollPending = false;
+function scheduleScroll() {
+  if (scrollPending) return;
+  scrollPending = true;
+  requestAnimationFrame(() => {
+    scrollPending = false;
+    const scrollArea = document.getElementById('scroll-area');
+    if (scrollArea) scrollArea.scrollTop = scrollArea.scrollHeight;
+  });
 }
 
 // Observe new messages
 const chat = document.getElementById('chat');
 if (chat) {
-  new MutationObserver(() => checkScroll(true)).observe(chat, { childList: true, subtree: true });
+  new MutationObserver(scheduleScroll).observe(chat, { childList: true, subtree: true });
 }
 
-window.onload = () => checkScroll(false);
+window.onload = scheduleScroll;
 '''
 
-CHAT_HTML_TEMPLATE = '''<!DOCTYPE html>
+# Page shell, split around its dynamic parts (pin hint, messages + status).
+# CSS and JS are injected by the WebView's UserContentManager instead.
+_SHELL_HEAD = '''<!DOCTYPE html>
 <html>
-<head><meta charset="UTF-8"><style>{CHAT_CSS}</style></head>
+<head><meta charset="UTF-8"></head>
 <body>
 <div class="chat-window">
   <div class="drag-handle" onmousedown="signalDrag()"></div>
-  {pin_hint}
+  <div class="pin-hint" id="pin-hint">'''
+_SHELL_CHAT = '''</div>
   <div class="chat-scroll-area" id="scroll-area">
-    <div id="chat" class="chat-container">{messages}</div>
+    <div id="chat" class="chat-container">'''
+_SHELL_TAIL = '''</div>
   </div>
 </div>
-<script>{CHAT_JS}</script>
 </body>
 </html>'''
 
 
+# ---------------------------------------------------------------------------
+# Markdown patterns (compiled once)
+# ---------------------------------------------------------------------------
+# Rendered text only lands in element content, so quotes need no escaping
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+_RE_FENCE = re.compile(r'```(?:\w+)?(?:\s*\n)(.*?)\n?```', re.DOTALL)
+_RE_INLINE_CODE = re.compile(r'`([^`]+)`')
+_RE_BOLD_STAR = re.compile(r'\*\*(.+?)\*\*')
+_RE_BOLD_UNDERSCORE = re.compile(r'__(.+?)__')
+_RE_ITALIC_STAR = re.compile(r'(?<!\w)\*([^*]+)\*(?!\w)')
+_RE_ITALIC_UNDERSCORE = re.compile(r'(?<!\w)_([^_]+)_(?!\w)')
+
+
+def _repl_code_block(match: re.Match) -> str:
+    """Wrap a fenced code block with its copy button."""
+    code_content = match.group(1).strip()
+    return (
+        f'<div class="code-block-wrapper">'
+        f'<button class="code-copy-btn" onclick="copyCode(this)" title="Copy Code">{SVG_COPY_ICON}</button>'
+        f'<pre><code>{code_content}</code></pre>'
+        f'</div>'
+    )
+
+
+# ---------------------------------------------------------------------------
+# Scheme-dependent CSS (schemes are static, so formatted once per scheme)
+# ---------------------------------------------------------------------------
+_CSS_CACHE: Dict[str, str] = {}
+
+
+def hex_to_rgba(hex_str: str, alpha: float) -> str:
+    """Convert hex color to CSS rgba() string."""
+    r, g, b = parse_hex(hex_str)
+    return f"rgba({r}, {g}, {b}, {alpha})"
+
+
+def get_contrast_text(bg_hex: str) -> str:
+    """Pick black or white text for a background (luminance-based)."""
+    r, g, b = parse_hex(bg_hex)
+    # Standard relative luminance formula
+    lum = (0.299 * r + 0.587 * g + 0.114 * b) / 255
+    return "#000000" if lum > 0.5 else "#FFFFFF"
+
+
+def _scheme_css(scheme_name: str) -> str:
+    """Return CHAT_CSS formatted for a color scheme (memoized)."""
+    css = _CSS_CACHE.get(scheme_name)
+    if css is not None:
+        return css
+
+    scheme = CFG.COLOR_SCHEMES.get(scheme_name, CFG.COLOR_SCHEMES[CFG.DEFAULT_SCHEME])
+    css_vars = {
+        "bg": scheme["bg"],
+        "bg_rgba": hex_to_rgba(scheme["bg"], 0.98),
+        "surface": scheme["surface"],
+        "surface_alpha80": hex_to_rgba(scheme["surface"], 0.8),
+        "accent": scheme["accent"],
+        "accent_alpha10": hex_to_rgba(scheme["accent"], 0.1),
+        "accent_alpha20": hex_to_rgba(scheme["accent"], 0.2),
+        "accent_alpha30": hex_to_rgba(scheme["accent"], 0.3),
+        "text": scheme["text"],
+        "text_on_accent": scheme["text"] if scheme_name == "Pink Orchid" else get_contrast_text(scheme["accent"]),
+        "success": scheme["accent"],
+        "dim_text": hex_to_rgba(scheme["text"], 0.6),
+        "selection_alpha90": hex_to_rgba(scheme["accent"], 0.3),
+        "white": scheme["text"],
+        "white_alpha05": hex_to_rgba(scheme["text"], 0.05),
+        "white_alpha10": hex_to_rgba(scheme["text"], 0.1),
+        "white_alpha25": hex_to_rgba(scheme["text"], 0.25),
+        "black_alpha40": hex_to_rgba(scheme["bg"], 0.4),
+    }
+    css = CHAT_CSS.format_map(css_vars)
+    _CSS_CACHE[scheme_name] = css
+    return css
+
+
 class ChatOverlay(Gtk.Window):
     """Chat overlay using WebKit2."""
 
+    # Fade: 5 steps of 32 ms (same ~160 ms duration as 10 x 16 ms)
+    FADE_TICK_MS: int = 32
+    FADE_STEP: float = 0.2
+
+    # Pin hint HTML per (is_pinned, is_tts); hotkey labels are static config
+    _pin_hint_cache: Dict[Tuple[bool, bool], str] = {}
+
     def __init__(self):
         super().__init__(type=Gtk.WindowType.TOPLEVEL)
+        # What the loaded page currently shows; updates are sent as deltas
+        self._shell_scheme: Optional[str] = None
+        self._page_ready = False
+        self._dom_msgs: List[Dict[str, str]] = []
+        self._dom_status = ""
+        self._dom_hint = ""
+        self._pending: Optional[Tuple[List[Dict[str, str]], str, str]] = None
+        # Frame-rate coalescing of update_content calls
+        self._update_timer: Optional[int] = None
+        self._pending_update: Optional[tuple] = None
         self._setup_window()
         self._setup_webview()
         self._init_animation()
@@ -345,7 +460,17 @@ class ChatOverlay(Gtk.Window):
         content_manager.register_script_message_handler("signal")
         content_manager.connect("script-message-received::signal", self._on_script_message)
 
+        # Page script is injected once per document; style sheet is set per scheme
+        content_manager.add_script(WebKit2.UserScript.new(
+            CHAT_JS,
+            WebKit2.UserContentInjectedFrames.TOP_FRAME,
+            WebKit2.UserScriptInjectionTime.END,
+            None, None
+        ))
+        self._content_manager = content_manager
+
         self.webview.connect("decide-policy", self._on_policy_decision)
+        self.webview.connect("load-changed", self._on_load_changed)
         self.add(self.webview)
 
     def _on_script_message(self, manager, message) -> None:
@@ -387,11 +512,11 @@ class ChatOverlay(Gtk.Window):
         self.fade_in_active = True
         self.opacity_value = 0.0
         self._cancel_fade_timer()
-        self.fade_timer = GLib.timeout_add(16, self._fade_in_step)
+        self.fade_timer = GLib.timeout_add(self.FADE_TICK_MS, self._fade_in_step)
 
     def _fade_in_step(self) -> bool:
         """Fade-in animation step."""
-        self.opacity_value = min(1.0, self.opacity_value + 0.1)
+        self.opacity_value = min(1.0, self.opacity_value + self.FADE_STEP)
         try:
             self.set_opacity(self.opacity_value)
         except Exception:
@@ -408,11 +533,11 @@ class ChatOverlay(Gtk.Window):
         self.fade_out_active = True
         self.fade_callback = callback
         self._cancel_fade_timer()
-        self.fade_timer = GLib.timeout_add(16, self._fade_out_step)
+        self.fade_timer = GLib.timeout_add(self.FADE_TICK_MS, self._fade_out_step)
 
     def _fade_out_step(self) -> bool:
         """Fade-out animation step."""
-        self.opacity_value = max(0.0, self.opacity_value - 0.1)
+        self.opacity_value = max(0.0, self.opacity_value - self.FADE_STEP)
         try:
             self.set_opacity(self.opacity_value)
         except Exception:
@@ -431,88 +556,136 @@ class ChatOverlay(Gtk.Window):
             GLib.source_remove(self.fade_timer)
             self.fade_timer = None
 
-    def update_content(self, messages: List[Dict[str, str]], status_text: Optional[str] = None,
+    def update_content(self, messages: Iterable[Dict[str, str]], status_text: Optional[str] = None,
                        is_pinned: bool = False, is_tts: bool = False) -> None:
-        """Update chat content with markdown rendering."""
-        html_messages = []
-
-        for idx, msg in enumerate(messages):
-            role = msg["role"]
-            rendered = self._render_markdown(msg["text"])
-            # Pass index, not ID, for robust handling
-            copy_btn = f'<button class="copy-btn" onclick="copyText(this, {idx})">{SVG_COPY_ICON}</button>'
-            msg_html = f'<div class="message"><div class="text">{rendered}</div></div>'
-
-            html_messages.append(
-                f'<div class="message-wrapper {role}">'
-                f'{msg_html}'
-                f'{copy_btn}'
-                f'</div>'
-            )
-
-        if status_text:
-            html_messages.append(f'<div class="message status">{status_text}</div>')
-
-        # Build pin hint - simple text with gear icon
+        """Queue a content update; calls within one frame render once."""
+        self._pending_update = (list(messages), status_text, is_pinned, is_tts)
+        if self._update_timer is None:
+            self._update_timer = GLib.timeout_add(16, self._flush_update)
+
+    def _flush_update(self) -> bool:
+        """Timer callback rendering the latest queued update."""
+        self._update_timer = None
+        args, self._pending_update = self._pending_update, None
+        if args:
+            self._do_update_content(*args)
+        return False
+
+    def _do_update_content(self, msgs: List[Dict[str, str]], status_text: Optional[str],
+                           is_pinned: bool, is_tts: bool) -> None:
+        """Update chat content, sending only the changes to a loaded page."""
+        status = status_text or ""
+        pin_hint = self._build_pin_hint(is_pinned, is_tts)
+
+        # Full load only for the first render or a color scheme change
+        if self._shell_scheme != STATE.color_scheme:
+            self._load_shell(msgs, status, pin_hint)
+            return
+
+        self._pending = (msgs, status, pin_hint)
+        if self._page_ready:
+            self._flush_pending()
+
+    @classmethod
+    def _build_pin_hint(cls, is_pinned: bool, is_tts: bool) -> str:
+        """Build pin hint contents - simple text with gear icon (cached)."""
+        cached = cls._pin_hint_cache.get((is_pinned, is_tts))
+        if cached is not None:
+            return cached
+
         pin_label = CFG.HOTKEY_DEFS["pin"][0]
         tts_label = CFG.HOTKEY_DEFS["tts"][0]
         pin_status = f"{pin_label}: Unpin" if is_pinned else f"{pin_label}: Pin"
         voice_status = f"{tts_label}: Mute" if is_tts else f"{tts_label}: Voice"
 
-        pin_hint = (
-            f'<div class="pin-hint">'
+        hint = (
             f'<span>{pin_status}</span>'
             f'<span style="opacity:0.2; margin:0 4px">|</span>'
             f'<span>{voice_status}</span>'
             f'<span style="opacity:0.2; margin:0 4px">|</span>'
             f'<a href="settings://open" class="settings-link" title="Settings">⚙️</a>'
-            f'</div>'
         )
-
-        # Prepare dynamic CSS with centralized colors
-        def hex_to_rgba(hex_str, alpha):
-            h = hex_str.lstrip('#')
-            rgb = tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
-            return f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {alpha})"
-
-        def get_contrast_text(bg_hex):
-            # Simple luminance-based contrast
-            h = bg_hex.lstrip('#')
-            rgb = [int(h[i:i+2], 16) for i in (0, 2, 4)]
-            # Standard relative luminance formula
-            lum = (0.299 * rgb[0] + 0.587 * rgb[1] + 0.114 * rgb[2]) / 255
-            return "#000000" if lum > 0.5 else "#FFFFFF"
-
-        scheme = CFG.COLOR_SCHEMES.get(STATE.color_scheme, CFG.COLOR_SCHEMES[CFG.DEFAULT_SCHEME])
-
-        formatted_css = CHAT_CSS.format(
-            bg=scheme["bg"],
-            bg_rgba=hex_to_rgba(scheme["bg"], 0.95),
-            surface=scheme["surface"],
-            surface_alpha80=hex_to_rgba(scheme["surface"], 0.8),
-            accent=scheme["accent"],
-            accent_alpha10=hex_to_rgba(scheme["accent"], 0.1),
-            accent_alpha20=hex_to_rgba(scheme["accent"], 0.2),
-            accent_alpha30=hex_to_rgba(scheme["accent"], 0.3),
-            text=scheme["text"],
-            text_on_accent=scheme["text"] if STATE.color_scheme == "Pink Orchid" else get_contrast_text(scheme["accent"]),
-            success=scheme["accent"],
-            dim_text=hex_to_rgba(scheme["text"], 0.6),
-            selection_alpha90=hex_to_rgba(scheme["accent"], 0.3),
-            white=scheme["text"],
-            white_alpha05=hex_to_rgba(scheme["text"], 0.05),
-            white_alpha10=hex_to_rgba(scheme["text"], 0.1),
-            white_alpha25=hex_to_rgba(scheme["text"], 0.25),
-            black_alpha40=hex_to_rgba(scheme["bg"], 0.4)
+        cls._pin_hint_cache[(is_pinned, is_tts)] = hint
+        return hint
+
+    @classmethod
+    def _render_message(cls, msg: Dict[str, str]) -> str:
+        """Render one chat message with its copy button."""
+        rendered = cls._render_markdown(msg["text"])
+        return (
+            f'<div class="message-wrapper {msg["role"]}">'
+            f'<div class="message"><div class="text">{rendered}</div></div>'
+            f'<button class="copy-btn" onclick="copyText(this)">{SVG_COPY_ICON}</button>'
+            f'</div>'
         )
 
-        html = CHAT_HTML_TEMPLATE.replace("{messages}", "\n".join(html_messages))
-        html = html.replace("{pin_hint}", pin_hint)
-        html = html.replace("{CHAT_CSS}", formatted_css)
-        html = html.replace("{CHAT_JS}", CHAT_JS)
-
+    def _load_shell(self, msgs: List[Dict[str, str]], status: str, pin_hint: str) -> None:
+        """Load the complete page; later updates are applied incrementally."""
+        hidden = "" if status else " hidden"
+        status_html = f'<div id="status" class="message status"{hidden}>{status}</div>'
+
+        self._content_manager.remove_all_style_sheets()
+        self._content_manager.add_style_sheet(WebKit2.UserStyleSheet.new(
+            _scheme_css(STATE.color_scheme),
+            WebKit2.UserContentInjectedFrames.TOP_FRAME,
+            WebKit2.UserStyleLevel.AUTHOR,
+            None, None
+        ))
+
+        html = "".join((
+            _SHELL_HEAD, pin_hint,
+            _SHELL_CHAT, "\n".join(map(self._render_message, msgs)), status_html,
+            _SHELL_TAIL,
+        ))
+
+        self._shell_scheme = STATE.color_scheme
+        self._page_ready = False
+        self._pending = None
+        self._dom_msgs = msgs
+        self._dom_status = status
+        self._dom_hint = pin_hint
         self.webview.load_html(html, None)
 
+    def _on_load_changed(self, webview, event) -> None:
+        """Apply updates that arrived while the page was loading."""
+        if event == WebKit2.LoadEvent.FINISHED:
+            self._page_ready = True
+            if self._pending:
+                self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Diff the pending state against the page and send JS deltas."""
+        msgs, status, pin_hint = self._pending
+        self._pending = None
+        calls = []
+
+        # Messages only ever drop from the front and append at the back
+        old = self._dom_msgs
+        drop = len(old)
+        if msgs:
+            drop = next((i for i, m in enumerate(old) if m is msgs[0]), len(old))
+        kept = len(old) - drop
+        if kept <= len(msgs) and all(old[drop + i] is msgs[i] for i in range(kept)):
+            if drop:
+                calls.append(f"lw.dropFirst({drop});")
+            if len(msgs) > kept:
+                added = [self._render_message(msg) for msg in msgs[kept:]]
+                calls.append(f"lw.appendMessages({json.dumps(added)});")
+        else:
+            rendered = [self._render_message(msg) for msg in msgs]
+            calls.append(f"lw.setMessages({json.dumps(rendered)});")
+        self._dom_msgs = msgs
+
+        if status != self._dom_status:
+            calls.append(f"lw.setStatus({json.dumps(status)});")
+            self._dom_status = status
+        if pin_hint != self._dom_hint:
+            calls.append(f"lw.setPinHint({json.dumps(pin_hint)});")
+            self._dom_hint = pin_hint
+
+        if calls:
+            self.webview.run_javascript("".join(calls), None, None, None)
+
     def _on_policy_decision(self, webview, decision, decision_type) -> bool:
         """Handle URI navigations (copy://, settings://)."""
         if decision_type == WebKit2.PolicyDecisionType.NAVIGATION_ACTION:
@@ -530,8 +703,8 @@ class ChatOverlay(Gtk.Window):
             if uri.startswith("copy://"):
                 try:
                     idx = int(uri.split("copy://")[1])
-                    if 0 <= idx < len(STATE.chat_messages):
-                        text = STATE.chat_messages[idx]["text"]
+                    if 0 <= idx < len(self._dom_msgs):
+                        text = self._dom_msgs[idx]["text"]
                         pyperclip.copy(text)
                 except Exception:
                     pass
@@ -541,28 +714,21 @@ class ChatOverlay(Gtk.Window):
         return False
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def _render_markdown(text: str) -> str:
-        """Convert simple markdown to HTML."""
-        text = html_lib.escape(text)
+        """Convert simple markdown to HTML (memoized per text)."""
+        text = text.translate(_HTML_ESCAPE_TABLE)
 
         # Code blocks with copy button
-        def repl_code_block(match):
-            code_content = match.group(1).strip()
-            return (
-                f'<div class="code-block-wrapper">'
-                f'<button class="code-copy-btn" onclick="copyCode(this)" title="Copy Code">{SVG_COPY_ICON}</button>'
-                f'<pre><code>{code_content}</code></pre>'
-                f'</div>'
-            )
-        text = re.sub(r'```(?:\w+)?(?:\s*\n)(.*?)\n?```', repl_code_block, text, flags=re.DOTALL)
+        text = _RE_FENCE.sub(_repl_code_block, text)
         # Inline code
-        text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
-        # Bold
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-        text = re.sub(r'__(.+?)__', r'<strong>\1</strong>', text)
+        text = _RE_INLINE_CODE.sub(r'<code>\1</code>', text)
+        # Bold (** then __, so one can nest inside the other)
+        text = _RE_BOLD_STAR.sub(r'<strong>\1</strong>', text)
+        text = _RE_BOLD_UNDERSCORE.sub(r'<strong>\1</strong>', text)
         # Italic
-        text = re.sub(r'(?<!\w)\*([^*]+)\*(?!\w)', r'<em>\1</em>', text)
-        text = re.sub(r'(?<!\w)_([^_]+)_(?!\w)', r'<em>\1</em>', text)
+        text = _RE_ITALIC_STAR.sub(r'<em>\1</em>', text)
+        text = _RE_ITALIC_UNDERSCORE.sub(r'<em>\1</em>', text)
         # Line breaks
         text = text.replace('\n', '<br>')
 
@@ -571,4 +737,7 @@ class ChatOverlay(Gtk.Window):
     def close(self) -> None:
         """Clean up and destroy."""
         self._cancel_fade_timer()
+        if self._update_timer:
+            GLib.source_remove(self._update_timer)
+            self._update_timer = None
         self.destroy()
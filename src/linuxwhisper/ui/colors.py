@@ -0,0 +1,20 @@
+"""
+Hex color parsing shared by the overlays and the settings dialog.
+"""
+from __future__ import annotations
+
+import functools
+from typing import Tuple
+
+
+def parse_hex(hex_str: str) -> Tuple[int, int, int]:
+    """Split a "#RRGGBB" color into 0-255 channel values."""
+    r, g, b = bytes.fromhex(hex_str.lstrip('#'))
+    return r, g, b
+
+
+@functools.lru_cache(maxsize=64)
+def hex_to_rgb(hex_str: str) -> Tuple[float, float, float]:
+    """Convert hex color to RGB tuple (0-1 range)."""
+    r, g, b = parse_hex(hex_str)
+    return r / 255.0, g / 255.0, b / 255.0
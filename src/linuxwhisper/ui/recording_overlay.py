@@ -4,14 +4,14 @@ Floating recording overlay with waveform visualization.
 from __future__ import annotations
 
 import math
-import queue
-from typing import Tuple
+from typing import Optional, Tuple
 
 import cairo
 import numpy as np
 
 from linuxwhisper.config import CFG
 from linuxwhisper.state import STATE
+from linuxwhisper.ui.colors import hex_to_rgb
 
 import gi
 gi.require_version('Gtk', '3.0')
@@ -21,10 +21,19 @@ from gi.repository import Gdk, GLib, Gtk
 class GtkOverlay(Gtk.Window):
     """Floating recording overlay with waveform visualization."""
 
+    # Redraw cadence: fast while frames arrive, slow once audio goes quiet
+    FAST_TICK_MS: int = 40
+    IDLE_TICK_MS: int = 500
+    IDLE_AFTER_MS: int = 250
+
     def __init__(self, mode: str):
         super().__init__(type=Gtk.WindowType.POPUP)
         self.mode = mode
         self.config = CFG.MODES.get(mode, CFG.MODES["dictation"])
+        self._colors_scheme: Optional[str] = None
+        self._chrome: Optional[cairo.ImageSurface] = None
+        self._chrome_key: Optional[tuple] = None
+        self._measure_text()
         self._setup_window()
         self._setup_ui()
         self.show_all()
@@ -56,14 +65,53 @@ class GtkOverlay(Gtk.Window):
         self.drawing_area = Gtk.DrawingArea()
         self.drawing_area.connect("draw", self._on_draw)
         self.add(self.drawing_area)
-        self.timeout_id = GLib.timeout_add(40, self._animate)
+        self._tick_ms = self.FAST_TICK_MS
+        self._quiet_ms = 0
+        self.timeout_id = GLib.timeout_add(self._tick_ms, self._animate)
+
+    def _measure_text(self) -> None:
+        """Measure the static icon and label once (they never change)."""
+        cr = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+        cr.select_font_face("Ubuntu", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL)
+        cr.set_font_size(20)
+        self._icon_ext = cr.text_extents(self.config["icon"])
+        cr.select_font_face("Ubuntu", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+        cr.set_font_size(10)
+        self._text_ext = cr.text_extents(self.config["text"])
+
+    def _update_colors(self) -> None:
+        """Resolve overlay colors, re-parsing only when the scheme changes."""
+        if self._colors_scheme == STATE.color_scheme:
+            return
+        scheme = CFG.COLOR_SCHEMES.get(STATE.color_scheme, CFG.COLOR_SCHEMES[CFG.DEFAULT_SCHEME])
+        self._bg_rgb = hex_to_rgb(scheme.get(self.config["bg"], scheme["bg"]))
+        self._fg_rgb = hex_to_rgb(scheme.get(self.config["fg"], scheme["accent"]))
+        self._idle_rgb = hex_to_rgb(scheme["surface"])
+        self._colors_scheme = STATE.color_scheme
 
     def _on_draw(self, widget: Gtk.DrawingArea, cr: cairo.Context) -> None:
         """Draw overlay content."""
         w, h = widget.get_allocated_width(), widget.get_allocated_height()
-        scheme = CFG.COLOR_SCHEMES.get(STATE.color_scheme, CFG.COLOR_SCHEMES[CFG.DEFAULT_SCHEME])
-        bg_rgb = self._hex_to_rgb(scheme.get(self.config["bg"], scheme["bg"]))
-        fg_rgb = self._hex_to_rgb(scheme.get(self.config["fg"], scheme["accent"]))
+        scale = widget.get_scale_factor()
+        self._update_colors()
+
+        # Static chrome is rendered once per size/scheme; frames only add the waveform
+        key = (w, h, scale, self._colors_scheme)
+        if self._chrome_key != key:
+            self._chrome = self._render_chrome(w, h, scale)
+            self._chrome_key = key
+        cr.set_source_surface(self._chrome, 0, 0)
+        cr.paint()
+
+        # Waveform
+        self._draw_waveform(cr, 60, 210, 45, self._fg_rgb)
+
+    def _render_chrome(self, w: int, h: int, scale: int) -> cairo.ImageSurface:
+        """Render background, icon and label into an offscreen surface."""
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, w * scale, h * scale)
+        surface.set_device_scale(scale, scale)
+        cr = cairo.Context(surface)
+        bg_rgb, fg_rgb = self._bg_rgb, self._fg_rgb
 
         # Background rounded rect
         self._draw_rounded_rect(cr, w, h, 15)
@@ -74,19 +122,17 @@ class GtkOverlay(Gtk.Window):
         cr.set_source_rgb(*fg_rgb)
         cr.select_font_face("Ubuntu", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL)
         cr.set_font_size(20)
-        ext = cr.text_extents(self.config["icon"])
+        ext = self._icon_ext
         cr.move_to(30 - ext.width / 2, h / 2 + ext.height / 2)
         cr.show_text(self.config["icon"])
 
         # Text
         cr.set_font_size(10)
         cr.select_font_face("Ubuntu", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-        ext = cr.text_extents(self.config["text"])
+        ext = self._text_ext
         cr.move_to(110 - ext.width / 2, 20)
         cr.show_text(self.config["text"])
-
-        # Waveform
-        self._draw_waveform(cr, 60, 210, 45, fg_rgb)
+        return surface
 
     def _draw_rounded_rect(self, cr: cairo.Context, w: int, h: int, r: int) -> None:
         """Draw rounded rectangle path."""
@@ -99,13 +145,9 @@ class GtkOverlay(Gtk.Window):
 
     def _draw_waveform(self, cr: cairo.Context, x1: int, x2: int, cy: int, color: Tuple[float, ...]) -> None:
         """Draw audio waveform bars."""
-        # Get latest audio data
-        data = None
-        while not STATE.viz_queue.empty():
-            try:
-                data = STATE.viz_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Latest audio frame (kept until a newer one replaces it)
+        viz = STATE.viz_latest
+        data = viz[-1] if viz else None
 
         cr.set_source_rgb(*color)
         cr.set_line_width(3)
@@ -118,39 +160,44 @@ class GtkOverlay(Gtk.Window):
             bar_width = width / num_bars
             max_height = 15
 
-            for i in range(num_bars):
-                idx = i * step
-                if idx >= len(data):
-                    break
-                chunk = data[idx:idx + step]
-                amp = np.max(np.abs(chunk)) if len(chunk) > 0 else 0
-                bar_h = max(1, min(max_height, amp * 40 * max_height))
+            # Peak per bar in one reshape+reduce (fewer bars if data is short)
+            bars = min(num_bars, len(data) // step)
+            amps = np.abs(data[:bars * step]).reshape(bars, step).max(axis=1)
+            heights = np.clip(amps * 40 * max_height, 1, max_height).tolist()
 
+            # All bars as sub-paths of one path, stroked once
+            for i, bar_h in enumerate(heights):
                 x = x1 + i * bar_width
                 cr.move_to(x, cy - bar_h)
                 cr.line_to(x, cy + bar_h)
-                cr.stroke()
+            cr.stroke()
         else:
             # Idle line
             cr.set_line_width(2)
-            scheme = CFG.COLOR_SCHEMES.get(STATE.color_scheme, CFG.COLOR_SCHEMES[CFG.DEFAULT_SCHEME])
-            idle_rgb = self._hex_to_rgb(scheme["surface"])
-            cr.set_source_rgb(*idle_rgb)
+            cr.set_source_rgb(*self._idle_rgb)
             cr.move_to(x1, cy)
             cr.line_to(x2, cy)
             cr.stroke()
 
     def _animate(self) -> bool:
-        """Animation tick."""
-        self.drawing_area.queue_draw()
+        """Animation tick: redraw on new waveform data, or slowly when idle."""
+        if STATE.viz_dirty:
+            STATE.viz_dirty = False
+            self._quiet_ms = 0
+            self.drawing_area.queue_draw()
+        else:
+            self._quiet_ms += self._tick_ms
+            if self._tick_ms == self.IDLE_TICK_MS:
+                self.drawing_area.queue_draw()
+
+        # Switch ticker rate when audio starts or stops arriving
+        tick = self.FAST_TICK_MS if self._quiet_ms < self.IDLE_AFTER_MS else self.IDLE_TICK_MS
+        if tick != self._tick_ms:
+            self._tick_ms = tick
+            self.timeout_id = GLib.timeout_add(tick, self._animate)
+            return False
         return True
 
-    @staticmethod
-    def _hex_to_rgb(hex_str: str) -> Tuple[float, float, float]:
-        """Convert hex color to RGB tuple (0-1 range)."""
-        h = hex_str.lstrip('#')
-        return tuple(int(h[i:i + 2], 16) / 255.0 for i in (0, 2, 4))
-
     def close(self) -> None:
         """Clean up and destroy."""
         if self.timeout_id:
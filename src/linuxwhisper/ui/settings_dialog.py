@@ -4,16 +4,175 @@ GTK Settings dialog for voice and hotkey configuration.
 from __future__ import annotations
 
 import math
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import cairo
 
 from linuxwhisper.config import CFG
 from linuxwhisper.state import STATE, SettingsManager
+from linuxwhisper.ui.colors import hex_to_rgb
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
+
+
+# Theme gallery swatch geometry (px)
+SWATCH_SIZE = 16
+SWATCH_SPACING = 3
+
+
+# Swatch colors per scheme (bg, surface, accent, text), parsed once at import
+_SCHEME_RGB: Dict[str, List[Tuple[float, float, float]]] = {
+    name: [hex_to_rgb(scheme[key]) for key in ("bg", "surface", "accent", "text")]
+    for name, scheme in CFG.COLOR_SCHEMES.items()
+}
+
+# Voice combo entries and voice -> row lookup
+_VOICE_TITLES: List[str] = [voice.title() for voice in CFG.TTS_VOICES]
+_VOICE_INDEX: Dict[str, int] = {voice: i for i, voice in enumerate(CFG.TTS_VOICES)}
+
+# Hotkey table rows as (display name, key label); static config
+_HOTKEY_DISPLAY_NAMES: Dict[str, str] = {
+    "dictation": "Dictation:",
+    "ai": "AI Chat:",
+    "ai_rewrite": "Rewrite:",
+    "vision": "Vision:",
+    "pin": "Pin Chat:",
+    "tts": "TTS Toggle:",
+}
+_HOTKEY_ROWS: List[Tuple[str, str]] = [
+    (_HOTKEY_DISPLAY_NAMES.get(mode_id, mode_id.replace("_", " ").title() + ":"), label)
+    for mode_id, (label, _, _) in CFG.HOTKEY_DEFS.items()
+]
+
+
+def _build_hotkey_markup(rows: List[Tuple[str, str]]) -> str:
+    """One monospace block: names padded into a column, keys dimmed."""
+    width = max(len(name) for name, _ in rows) + 2
+    lines = [
+        f"{GLib.markup_escape_text(name.ljust(width))}<span alpha='60%'>{GLib.markup_escape_text(key)}</span>"
+        for name, key in rows
+    ]
+    return "<tt>" + "\n".join(lines) + "</tt>"
+
+
+_HOTKEY_MARKUP = _build_hotkey_markup(_HOTKEY_ROWS)
+
+
+# Static dialog layout; dynamic parts (voices, theme rows, hotkeys) are filled in Python
+_DIALOG_UI = """<?xml version="1.0" encoding="UTF-8"?>
+<interface>
+  <requires lib="gtk+" version="3.20"/>
+  <object class="GtkWindow" id="dialog">
+    <property name="title">LinuxWhisper Settings</property>
+    <property name="default_width">400</property>
+    <property name="default_height">580</property>
+    <property name="resizable">False</property>
+    <property name="window_position">center</property>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">vertical</property>
+        <property name="spacing">15</property>
+        <property name="margin_top">20</property>
+        <property name="margin_bottom">20</property>
+        <property name="margin_start">20</property>
+        <property name="margin_end">20</property>
+        <child>
+          <object class="GtkLabel">
+            <property name="label">&lt;b&gt;TTS Voice&lt;/b&gt;</property>
+            <property name="use_markup">True</property>
+            <property name="halign">start</property>
+          </object>
+          <packing>
+            <property name="expand">False</property>
+            <property name="fill">False</property>
+          </packing>
+        </child>
+        <child>
+          <object class="GtkComboBoxText" id="voice_combo"/>
+          <packing>
+            <property name="expand">False</property>
+            <property name="fill">False</property>
+          </packing>
+        </child>
+        <child>
+          <object class="GtkLabel">
+            <property name="label">&lt;b&gt;Color Scheme Gallery&lt;/b&gt;</property>
+            <property name="use_markup">True</property>
+            <property name="halign">start</property>
+          </object>
+          <packing>
+            <property name="expand">False</property>
+            <property name="fill">False</property>
+          </packing>
+        </child>
+        <child>
+          <object class="GtkScrolledWindow">
+            <property name="hscrollbar_policy">never</property>
+            <property name="vscrollbar_policy">automatic</property>
+            <property name="height_request">280</property>
+            <property name="shadow_type">in</property>
+            <child>
+              <object class="GtkListBox" id="listbox">
+                <property name="selection_mode">single</property>
+              </object>
+            </child>
+          </object>
+          <packing>
+            <property name="expand">True</property>
+            <property name="fill">True</property>
+          </packing>
+        </child>
+        <child>
+          <object class="GtkLabel">
+            <property name="label">&lt;b&gt;Hotkeys&lt;/b&gt;</property>
+            <property name="use_markup">True</property>
+            <property name="halign">start</property>
+          </object>
+          <packing>
+            <property name="expand">False</property>
+            <property name="fill">False</property>
+            <property name="padding">10</property>
+          </packing>
+        </child>
+        <child>
+          <object class="GtkLabel" id="hotkey_table">
+            <property name="justify">left</property>
+            <property name="halign">start</property>
+          </object>
+          <packing>
+            <property name="expand">False</property>
+            <property name="fill">False</property>
+          </packing>
+        </child>
+        <child>
+          <object class="GtkLabel">
+            <property name="label">&lt;small&gt;&lt;i&gt;(Hotkeys are defined in config.py.)&lt;/i&gt;&lt;/small&gt;</property>
+            <property name="use_markup">True</property>
+            <property name="halign">start</property>
+          </object>
+          <packing>
+            <property name="expand">False</property>
+            <property name="fill">False</property>
+            <property name="padding">10</property>
+          </packing>
+        </child>
+        <child>
+          <object class="GtkButton" id="close_btn">
+            <property name="label">Close</property>
+          </object>
+          <packing>
+            <property name="expand">False</property>
+            <property name="fill">False</property>
+            <property name="pack_type">end</property>
+          </packing>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
 
 
 class SettingsDialog:
@@ -21,6 +180,7 @@ class SettingsDialog:
 
     _instance: Optional[Gtk.Window] = None
     _listbox: Optional[Gtk.ListBox] = None
+    _rows_cache: Dict[str, Gtk.ListBoxRow] = {}  # Theme rows reused across dialog instances
 
     @classmethod
     def show(cls) -> None:
@@ -34,138 +194,73 @@ class SettingsDialog:
 
     @classmethod
     def _create_dialog(cls) -> Gtk.Window:
-        """Create the settings dialog window."""
-        dialog = Gtk.Window(title="LinuxWhisper Settings")
-        dialog.set_default_size(400, 580)
-        dialog.set_resizable(False)
-        dialog.set_position(Gtk.WindowPosition.CENTER)
+        """Create the settings dialog window from the static UI definition."""
+        builder = Gtk.Builder.new_from_string(_DIALOG_UI, -1)
+        dialog = builder.get_object("dialog")
         dialog.set_keep_above(True)
 
-        # Main container
-        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=15)
-        vbox.set_margin_top(20)
-        vbox.set_margin_bottom(20)
-        vbox.set_margin_start(20)
-        vbox.set_margin_end(20)
-
         # --- Voice Section ---
-        voice_label = Gtk.Label(label="TTS Voice")
-        voice_label.set_halign(Gtk.Align.START)
-        voice_label.set_markup("<b>TTS Voice</b>")
-        vbox.pack_start(voice_label, False, False, 0)
-
-        voice_combo = Gtk.ComboBoxText()
-        for voice in CFG.TTS_VOICES:
-            voice_combo.append_text(voice.title())
-        voice_combo.set_active(CFG.TTS_VOICES.index(STATE.tts_voice) if STATE.tts_voice in CFG.TTS_VOICES else 0)
+        voice_combo = builder.get_object("voice_combo")
+        for title in _VOICE_TITLES:
+            voice_combo.append_text(title)
+        voice_combo.set_active(_VOICE_INDEX.get(STATE.tts_voice, 0))
         voice_combo.connect("changed", cls._on_voice_changed)
-        vbox.pack_start(voice_combo, False, False, 0)
 
         # --- Color Scheme Gallery ---
-        scheme_label = Gtk.Label()
-        scheme_label.set_halign(Gtk.Align.START)
-        scheme_label.set_markup("<b>Color Scheme Gallery</b>")
-        vbox.pack_start(scheme_label, False, False, 0)
-
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scrolled.set_size_request(-1, 280)
-        scrolled.set_shadow_type(Gtk.ShadowType.IN)
-
-        cls._listbox = Gtk.ListBox()
-        cls._listbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
+        cls._listbox = builder.get_object("listbox")
         cls._listbox.connect("row-activated", cls._on_scheme_selected)
 
         schemes = list(CFG.COLOR_SCHEMES.keys())
         for name in schemes:
-            row = cls._create_theme_row(name)
+            row = cls._rows_cache.get(name)
+            if row is None:
+                row = cls._rows_cache[name] = cls._create_theme_row(name)
+            elif row.get_parent():
+                row.get_parent().remove(row)
             cls._listbox.add(row)
             if name == STATE.color_scheme:
                 cls._listbox.select_row(row)
 
-        scrolled.add(cls._listbox)
-        vbox.pack_start(scrolled, True, True, 0)
-
         # --- Hotkeys Section ---
-        hotkey_label = Gtk.Label()
-        hotkey_label.set_halign(Gtk.Align.START)
-        hotkey_label.set_markup("<b>Hotkeys</b>")
-        vbox.pack_start(hotkey_label, False, False, 10)
-
-        hotkey_grid = Gtk.Grid()
-        hotkey_grid.set_column_spacing(15)
-        hotkey_grid.set_row_spacing(8)
-
-        hotkeys = []
-        display_names = {
-            "dictation": "Dictation:",
-            "ai": "AI Chat:",
-            "ai_rewrite": "Rewrite:",
-            "vision": "Vision:",
-            "pin": "Pin Chat:",
-            "tts": "TTS Toggle:",
-        }
-
-        for mode_id, (label, _, _) in CFG.HOTKEY_DEFS.items():
-            name = display_names.get(mode_id, mode_id.replace("_", " ").title() + ":")
-            hotkeys.append((name, label))
-
-        for i, (name, key) in enumerate(hotkeys):
-            name_label = Gtk.Label(label=name)
-            name_label.set_halign(Gtk.Align.START)
-            key_label = Gtk.Label(label=key)
-            key_label.set_halign(Gtk.Align.START)
-            key_label.get_style_context().add_class("dim-label")
-            hotkey_grid.attach(name_label, 0, i, 1, 1)
-            hotkey_grid.attach(key_label, 1, i, 1, 1)
-
-        vbox.pack_start(hotkey_grid, False, False, 0)
-
-        # Info label
-        info_label = Gtk.Label()
-        info_label.set_markup("<small><i>(Hotkeys are defined in config.py.)</i></small>")
-        info_label.set_halign(Gtk.Align.START)
-        vbox.pack_start(info_label, False, False, 10)
+        builder.get_object("hotkey_table").set_markup(_HOTKEY_MARKUP)
 
         # --- Close Button ---
-        close_btn = Gtk.Button(label="Close")
-        close_btn.connect("clicked", lambda w: dialog.destroy())
-        vbox.pack_end(close_btn, False, False, 0)
+        builder.get_object("close_btn").connect("clicked", lambda w: dialog.destroy())
 
-        dialog.add(vbox)
-        dialog.connect("destroy", lambda w: setattr(cls, '_instance', None))
+        dialog.connect("destroy", cls._on_destroy)
 
         return dialog
 
+    @classmethod
+    def _on_destroy(cls, dialog: Gtk.Window) -> None:
+        """Flush pending settings and detach cached theme rows before teardown."""
+        SettingsManager.flush(STATE)
+        if cls._listbox:
+            for row in cls._rows_cache.values():
+                if row.get_parent() is cls._listbox:
+                    cls._listbox.remove(row)
+            cls._listbox = None
+        cls._instance = None
+
     @staticmethod
     def _on_voice_changed(combo: Gtk.ComboBoxText) -> None:
         """Handle voice selection change."""
         voice = combo.get_active_text().lower()
         STATE.tts_voice = voice
         print(f"🎙️ Voice changed to: {voice}")
-        SettingsManager.save(STATE)
+        SettingsManager.save_debounced(STATE)
 
     @staticmethod
     def _on_scheme_selected(listbox: Gtk.ListBox, row: Gtk.ListBoxRow) -> None:
         """Handle theme gallery selection."""
         if not row:
             return
-        # Find theme name from child labels
-        name = None
-        def find_name(child):
-            nonlocal name
-            if isinstance(child, Gtk.Label) and not child.get_style_context().has_class("dim-label"):
-                name = child.get_text()
-            elif hasattr(child, "get_children"):
-                for c in child.get_children():
-                    find_name(c)
-
-        find_name(row.get_child())
+        name = row.get_name()  # Theme name stored on the row at creation
 
         if name in CFG.COLOR_SCHEMES:
             STATE.color_scheme = name
             print(f"🎨 Color scheme changed to: {name}")
-            SettingsManager.save(STATE)
+            SettingsManager.save_debounced(STATE)
             # Late import to avoid circular dependency
             from linuxwhisper.managers.chat import ChatManager
             ChatManager.refresh_overlay()
@@ -175,6 +270,7 @@ class SettingsDialog:
         """Create a visual card for a theme in the gallery."""
         scheme = CFG.COLOR_SCHEMES[name]
         row = Gtk.ListBoxRow()
+        row.set_name(name)
         row.set_margin_top(4)
         row.set_margin_bottom(4)
 
@@ -184,16 +280,11 @@ class SettingsDialog:
         hbox.set_margin_top(8)
         hbox.set_margin_bottom(8)
 
-        # --- Preview Swatches ---
-        swatch_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=3)
-        colors = [scheme["bg"], scheme["surface"], scheme["accent"], scheme["text"]]
-        for hex_color in colors:
-            swatch = Gtk.DrawingArea()
-            swatch.set_size_request(16, 16)
-            swatch.connect("draw", cls._on_draw_gallery_swatch, hex_color)
-            swatch_box.pack_start(swatch, False, False, 0)
-
-        hbox.pack_start(swatch_box, False, False, 0)
+        # --- Preview Swatches (pre-rendered once into a single image) ---
+        swatches = cls._render_swatches(_SCHEME_RGB[name], row.get_scale_factor())
+        swatch_image = Gtk.Image.new_from_surface(swatches)
+        swatch_image.set_valign(Gtk.Align.CENTER)
+        hbox.pack_start(swatch_image, False, False, 0)
 
         # --- Name & Description ---
         text_vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
@@ -216,18 +307,21 @@ class SettingsDialog:
         return row
 
     @staticmethod
-    def _on_draw_gallery_swatch(widget: Gtk.DrawingArea, cr: cairo.Context, hex_color: str) -> bool:
-        """Draw a small color swatch circle in the gallery row."""
-        # Convert hex to RGB
-        h = hex_color.lstrip('#')
-        rgb = tuple(int(h[i:i+2], 16) / 255.0 for i in (0, 2, 4))
-
-        # Draw circle
-        w, h = widget.get_allocated_width(), widget.get_allocated_height()
-        cr.arc(w/2, h/2, min(w, h)/2 - 1, 0, 2 * math.pi)
-        cr.set_source_rgb(*rgb)
-        cr.fill_preserve()
-        cr.set_source_rgba(0, 0, 0, 0.15)
+    def _render_swatches(colors: List[Tuple[float, float, float]], scale: int) -> cairo.ImageSurface:
+        """Render the color swatch circles of a gallery row into one surface."""
+        size, spacing = SWATCH_SIZE, SWATCH_SPACING
+        width = len(colors) * size + (len(colors) - 1) * spacing
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width * scale, size * scale)
+        surface.set_device_scale(scale, scale)
+        cr = cairo.Context(surface)
         cr.set_line_width(1)
-        cr.stroke()
-        return True
+
+        for i, rgb in enumerate(colors):
+            # Draw circle
+            cx = i * (size + spacing) + size / 2
+            cr.arc(cx, size / 2, size / 2 - 1, 0, 2 * math.pi)
+            cr.set_source_rgb(*rgb)
+            cr.fill_preserve()
+            cr.set_source_rgba(0, 0, 0, 0.15)
+            cr.stroke()
+        return surface
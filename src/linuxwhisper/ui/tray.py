@@ -5,9 +5,8 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Callable, Dict
+from typing import Callable, List, Optional, Tuple
 
-from linuxwhisper.config import CFG
 from linuxwhisper.decorators import run_on_main_thread
 from linuxwhisper.state import STATE
 
@@ -18,9 +17,17 @@ from gi.repository import AyatanaAppIndicator3 as AppIndicator
 from gi.repository import Gtk
 
 
+# Leading label such as "[Dictation] "
+_PREFIX_RE = re.compile(r"^\[.*?\]\s*")
+
+
 class TrayManager:
     """System tray (AppIndicator) management."""
 
+    # What the installed menu shows: (history data, chat_enabled, toggle_mode)
+    _menu_sig: Optional[tuple] = None
+    _history_items: List[Gtk.MenuItem] = []
+
     @staticmethod
     def start() -> None:
         """Initialize and start system tray."""
@@ -35,16 +42,54 @@ class TrayManager:
         Gtk.main()
 
     @staticmethod
-    @run_on_main_thread
     def update_menu() -> None:
-        """Rebuild and update tray menu."""
+        """Rebuild and update tray menu (callable from any thread)."""
+        TrayManager._apply_menu_data(TrayManager._prepare_menu_data())
+
+    @staticmethod
+    def _prepare_menu_data() -> List[Tuple[str, str]]:
+        """Collect history entries as (label, text) pairs; pure Python, no GTK."""
+        items = tuple(STATE.answer_history)  # Single C-level copy; clear_all may run meanwhile
+        return [(item["label"], item["text"]) for item in items]
+
+    @staticmethod
+    @run_on_main_thread
+    def _apply_menu_data(data: List[Tuple[str, str]]) -> None:
+        """Build the menu from prepared data and install it (GTK thread)."""
         if not STATE.indicator:
             return
-        STATE.gtk_menu = TrayManager._build_menu()
-        STATE.indicator.set_menu(STATE.gtk_menu)
+        sig = (tuple(data), STATE.chat_enabled, STATE.toggle_mode)
+        old = TrayManager._menu_sig
+        if sig == old:
+            return
+
+        # Common case: one answer added at the top (oldest possibly dropped)
+        if (old and old[0] and data and STATE.gtk_menu and old[1:] == sig[1:]
+                and old[0][:len(data) - 1] == sig[0][1:]):
+            TrayManager._prepend_history_item(data[0], len(data))
+        else:
+            STATE.gtk_menu = TrayManager._build_menu(data)
+            STATE.indicator.set_menu(STATE.gtk_menu)
+        TrayManager._menu_sig = sig
 
     @staticmethod
-    def _build_menu() -> Gtk.Menu:
+    def _prepend_history_item(entry: Tuple[str, str], count: int) -> None:
+        """Insert a history item at the top of the live menu, keeping `count` items."""
+        from linuxwhisper.services.clipboard import ClipboardService
+
+        label, text = entry
+        menu_item = Gtk.MenuItem(label=label)
+        menu_item.connect("activate", TrayManager._make_history_callback(text, ClipboardService))
+        menu_item.show()
+        STATE.gtk_menu.insert(menu_item, 0)
+
+        items = TrayManager._history_items
+        items.insert(0, menu_item)
+        while len(items) > count:
+            STATE.gtk_menu.remove(items.pop())
+
+    @staticmethod
+    def _build_menu(data: List[Tuple[str, str]]) -> Gtk.Menu:
         """Build GTK menu for tray."""
         # Late imports to avoid circular dependencies
         from linuxwhisper.managers.history import HistoryManager
@@ -52,17 +97,15 @@ class TrayManager:
         from linuxwhisper.ui.settings_dialog import SettingsDialog
 
         menu = Gtk.Menu()
+        TrayManager._history_items = []
 
         # History items
-        if STATE.answer_history:
-            for item in STATE.answer_history[:CFG.ANSWER_HISTORY_LIMIT]:
-                preview = item["text"][:50].replace("\n", " ")
-                if len(item["text"]) > 50:
-                    preview += "..."
-                label = f"[{item['timestamp']}] {preview}"
+        if data:
+            for label, text in data:
                 menu_item = Gtk.MenuItem(label=label)
-                menu_item.connect("activate", TrayManager._make_history_callback(item, ClipboardService))
+                menu_item.connect("activate", TrayManager._make_history_callback(text, ClipboardService))
                 menu.append(menu_item)
+                TrayManager._history_items.append(menu_item)
             menu.append(Gtk.SeparatorMenuItem())
         else:
             empty = Gtk.MenuItem(label="(No History)")
@@ -105,11 +148,11 @@ class TrayManager:
         return menu
 
     @staticmethod
-    def _make_history_callback(item: Dict[str, str], clipboard_service) -> Callable:
+    def _make_history_callback(text: str, clipboard_service) -> Callable:
         """Create callback for history item click."""
         def callback(widget):
             # Remove prefix labels like [Dictation]
-            clean = re.sub(r"^\[.*?\]\s*", "", item["text"])
+            clean = _PREFIX_RE.sub("", text, count=1) if text.startswith("[") else text
             clipboard_service.paste_text(clean)
         return callback
 
@@ -136,5 +179,7 @@ class TrayManager:
     @staticmethod
     def _quit(widget) -> None:
         """Quit application."""
+        from linuxwhisper.state import SettingsManager
+        SettingsManager.flush(STATE)
         Gtk.main_quit()
         os._exit(0)
@@ -0,0 +1,34 @@
+"""
+Conversation history reaching the chat prompt.
+"""
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("GROQ_API_KEY", "test")
+
+from linuxwhisper.config import CFG
+from linuxwhisper.managers.history import HistoryManager
+from linuxwhisper.services.ai import AIService
+from linuxwhisper.state import STATE
+
+
+def _reset_history() -> None:
+    STATE.conversation_history = []
+    STATE.history_tokens = []
+    STATE.history_token_count = 0
+    STATE.history_summary = ""
+
+
+def test_unsummarized_turns_reach_the_prompt():
+    """Messages past HISTORY_MAX_TURNS but not yet summarized are still sent."""
+    _reset_history()
+    count = 2 * CFG.HISTORY_MAX_TURNS  # Below the summarization threshold
+    for i in range(count):
+        HistoryManager.add_message("user" if i % 2 == 0 else "assistant", f"message {i}")
+
+    sent = [m["content"] for m in AIService.build_messages("next")]
+
+    for i in range(count):
+        assert f"message {i}" in sent
+    _reset_history()